@@ -5,12 +5,171 @@ This module defines the character classes used in the game,
 including the base Character class and specialized character types.
 """
 
+import bisect
 import random
+from functools import lru_cache
+
+
+def _deplete(water, food, water_amount, food_amount, efficiency=0):
+    """Advance water and food stocks by one turn of consumption.
+
+    Both character models share this arithmetic; they only differ in what
+    reduces their intake (survival skills or years of experience) and in
+    how shortages affect their health.
+
+    Args:
+        water (int): Current water level
+        food (int): Current food level
+        water_amount (int): Base amount of water to consume
+        food_amount (int): Base amount of food to consume
+        efficiency (int): Skill level (0-100) reducing intake by up to 50%
+
+    Returns:
+        tuple: New (water, food) levels, never below zero
+    """
+    if efficiency > 0:
+        factor = 1.0 - (efficiency / 200)
+        water_amount = max(1, int(water_amount * factor))
+        food_amount = max(1, int(food_amount * factor))
+    return max(0, water - water_amount), max(0, food - food_amount)
+
+
+# Effect bits returned by _shortage_effects(), in reporting order
+_SEVERE_THIRST = 1
+_THIRST = 2
+_SEVERE_HUNGER = 4
+_HUNGER = 8
+_LOW_MORALE = 16
+_EFFECT_BITS = (_SEVERE_THIRST, _THIRST, _SEVERE_HUNGER, _HUNGER, _LOW_MORALE)
+
+
+def _shortage_effects(water, food, low_morale, penalties):
+    """Work out how supply levels and morale affect health this turn.
+
+    Args:
+        water (int): Current water level
+        food (int): Current food level
+        low_morale (bool): Whether morale is low enough to hurt health
+        penalties (tuple): Health loss for each bit in _EFFECT_BITS
+
+    Returns:
+        tuple: (health_loss, flags) where flags is a bitmask of _EFFECT_BITS
+    """
+    health_loss = 0
+    flags = 0
+    if water <= 0:
+        health_loss += penalties[0]
+        flags |= _SEVERE_THIRST
+    elif water < 20:
+        health_loss += penalties[1]
+        flags |= _THIRST
+    if food <= 0:
+        health_loss += penalties[2]
+        flags |= _SEVERE_HUNGER
+    elif food < 20:
+        health_loss += penalties[3]
+        flags |= _HUNGER
+    if low_morale:
+        health_loss += penalties[4]
+        flags |= _LOW_MORALE
+    return health_loss, flags
+
+
+@lru_cache(maxsize=64)
+def _shortage_message(character_class, flags, tier):
+    """Build the status message for a combination of shortage effects.
+
+    The same few combinations recur every turn, so each message is built
+    once with the character's name left as a "{}" placeholder.
+
+    Args:
+        character_class (type): Class supplying SHORTAGE_EFFECTS and SEVERITY_MESSAGES
+        flags (int): Bitmask of _EFFECT_BITS from _shortage_effects()
+        tier (int): Index into SEVERITY_MESSAGES
+
+    Returns:
+        str: Message template to format with the character's name
+    """
+    effects = [name for bit, name in zip(_EFFECT_BITS, character_class.SHORTAGE_EFFECTS) if flags & bit]
+    return character_class.SEVERITY_MESSAGES[tier].format("{}", ' and '.join(effects))
+
+
+def _stress_increase(base_stress, experience):
+    """Scale an encounter's base stress by the agent's experience.
+
+    Args:
+        base_stress (int): Raw stress of the encounter
+        experience (int): Agent experience level (0-100)
+
+    Returns:
+        int: Stress actually gained, at least 20% of the base
+    """
+    experience_factor = max(0.2, 1.0 - (experience / 120))
+    return int(base_stress * experience_factor)
+
+
+# Message tiers are looked up by the size of a change: none, small, large, very large
+_HOPE_CHANGE_TIERS = (0, 10, 20)
+_HOPE_GAIN_MESSAGES = (
+    "{}'s hope remains unchanged.",
+    "{} feels a bit more hopeful.",
+    "{} feels significantly more hopeful.",
+    "{} feels a powerful surge of hope.",
+)
+_HOPE_LOSS_MESSAGES = (
+    "{}'s hope remains unchanged.",
+    "{} feels slightly less hopeful.",
+    "{}'s hope diminishes significantly.",
+    "{} feels overwhelmed by despair.",
+)
+
+_STANDING_CHANGE_TIERS = (0, 15)
+_STANDING_GAIN_MESSAGES = (
+    "{}'s departmental standing remains unchanged.",
+    "{}'s reputation in the department has slightly improved.",
+    "{}'s actions have significantly improved their standing in the department.",
+)
+_STANDING_LOSS_MESSAGES = (
+    "{}'s departmental standing remains unchanged.",
+    "{}'s standing in the department has slightly suffered.",
+    "{}'s actions have seriously damaged their reputation in the department.",
+)
+
+# Reputation tiers start at these department standing values
+_STANDING_TIERS = (20, 40, 60, 80)
+_STANDING_DESCRIPTIONS = (
+    "Your reputation within the department has suffered.",
+    "Some colleagues question your commitment to the job.",
+    "Your standing in the department is average.",
+    "You have a good reputation among your colleagues.",
+    "You're highly respected within the department.",
+)
+
+# Stress above each threshold costs (health, effect)
+_STRESS_TIERS = (40, 60, 80)
+_STRESS_EFFECTS = (
+    (0, None),
+    (0, "preoccupation with work"),
+    (2, "trouble sleeping"),
+    (5, "severe burnout"),
+)
 
 
 class Character:
     """Base character class for all game characters."""
     
+    __slots__ = ("name", "description", "health", "inventory", "location", "story_flags",
+                 "traits", "_desc_version", "_desc_cache")
+    
+    # Numeric stats this class defines, so callers can test membership instead of hasattr
+    STATS = frozenset({"health"})
+    
+    # Water and food used per turn before location modifiers; None for characters that don't consume
+    BASE_CONSUMPTION = None
+    # (water scarcity divisor, extra food) added in a desert, and food saved where a settlement sells it
+    DESERT_CONSUMPTION = (1, 0)
+    SETTLEMENT_FOOD_DISCOUNT = 0
+    
     def __init__(self, name, description, health=100):
         """Initialize a character with basic attributes.
         
@@ -25,13 +184,32 @@ class Character:
         self.inventory = []
         self.location = None
         self.story_flags = {}
-        self.traits = []  # Character personality traits for more depth
+        self.traits = set()  # Character personality traits for more depth
+        self._desc_version = 0  # Bumped whenever a described attribute changes
+        self._desc_cache = (None, None)  # (version key, rendered description)
         
     def describe(self):
-        """Return a description of the character."""
+        """Return a description of the character.
+        
+        The rendered text is reused until something it shows changes.
+        """
+        key = self._describe_key()
+        cached_key, cached_desc = self._desc_cache
+        if cached_key == key:
+            return cached_desc
+        desc = self._render_description()
+        self._desc_cache = (key, desc)
+        return desc
+    
+    def _describe_key(self):
+        """Return a value that changes whenever describe() output would."""
+        return self._desc_version
+    
+    def _render_description(self):
+        """Build the character description from scratch."""
         base_desc = f"{self.name}: {self.description}"
         if self.traits:
-            base_desc += f"\nTraits: {', '.join(self.traits)}"
+            base_desc += f"\nTraits: {', '.join(sorted(self.traits))}"
         return base_desc
     
     def add_to_inventory(self, item):
@@ -41,15 +219,20 @@ class Character:
     
     def remove_from_inventory(self, item):
         """Remove an item from the character's inventory if present."""
-        if item in self.inventory:
+        try:
             self.inventory.remove(item)
-            return f"{self.name} no longer has {item}."
-        return f"{self.name} doesn't have {item}."
+        except ValueError:
+            return f"{self.name} doesn't have {item}."
+        return f"{self.name} no longer has {item}."
     
     def set_flag(self, flag_name, value):
         """Set a story flag for this character."""
         self.story_flags[flag_name] = value
     
+    def set_flags(self, flags):
+        """Set several story flags at once from a mapping or (flag name, value) pairs."""
+        self.story_flags.update(flags)
+    
     def has_flag(self, flag_name):
         """Check if a story flag exists and is True."""
         return self.story_flags.get(flag_name, False)
@@ -57,7 +240,8 @@ class Character:
     def add_trait(self, trait):
         """Add a personality trait to the character."""
         if trait not in self.traits:
-            self.traits.append(trait)
+            self.traits.add(trait)
+            self._desc_version += 1
             return f"{self.name} now has the trait: {trait}"
         return f"{self.name} already has the trait: {trait}"
     
@@ -69,6 +253,23 @@ class Character:
 class Migrant(Character):
     """Class representing a migrant character."""
     
+    __slots__ = ("origin", "motivation", "water", "food", "hope", "money", "family_ties",
+                 "survival_skills", "trauma")
+    
+    STATS = Character.STATS | {"water", "food", "hope", "money", "survival_skills", "trauma"}
+    
+    # Health loss and names for severe/moderate dehydration, starvation/hunger, despair
+    SHORTAGE_PENALTIES = (20, 5, 8, 3, 2)
+    SHORTAGE_EFFECTS = ("severe dehydration", "dehydration", "starvation", "hunger", "despair")
+    
+    BASE_CONSUMPTION = (5, 5)
+    DESERT_CONSUMPTION = (2, 2)
+    SETTLEMENT_FOOD_DISCOUNT = 3
+    # Status message for health loss of 0, up to 15, and above 15
+    SEVERITY_TIERS = (0, 15)
+    SEVERITY_MESSAGES = ("{} is experiencing {}.", "{} is suffering from {}.",
+                         "{} is severely weakened by {}.")
+    
     def __init__(self, name, description, origin, motivation, health=100):
         """Initialize a migrant character.
         
@@ -90,9 +291,9 @@ class Migrant(Character):
         self.survival_skills = 0  # Grows with experience (0-100)
         self.trauma = 0  # Trauma accumulation (0-100)
         
-    def describe(self):
-        """Return a detailed description of the migrant."""
-        base_desc = super().describe()
+    def _render_description(self):
+        """Build a detailed description of the migrant."""
+        base_desc = super()._render_description()
         detailed_desc = f"{base_desc}\nOrigin: {self.origin}\nMotivation: {self.motivation}"
         
         # Add family ties if present
@@ -112,55 +313,24 @@ class Migrant(Character):
         Returns:
             str: Description of resource consumption effects
         """
-        # Apply survival skills to reduce consumption (if applicable)
-        if self.survival_skills > 0:
-            skill_factor = 1.0 - (self.survival_skills / 200)  # Max 50% reduction at 100 skill
-            water_amount = max(1, int(water_amount * skill_factor))
-            food_amount = max(1, int(food_amount * skill_factor))
-        
-        # Consume resources
-        self.water = max(0, self.water - water_amount)
-        self.food = max(0, self.food - food_amount)
-        
-        # Health effects
-        health_loss = 0
-        effects = []
+        # Survival skills reduce consumption (max 50% reduction at 100 skill)
+        self.water, self.food = _deplete(self.water, self.food, water_amount, food_amount,
+                                         self.survival_skills)
         
-        # Water effects
-        if self.water <= 0:
-            health_loss += 20  # Severe dehydration
-            effects.append("severe dehydration")
-        elif self.water < 20:
-            health_loss += 5   # Moderate dehydration
-            effects.append("dehydration")
-            
-        # Food effects
-        if self.food <= 0:
-            health_loss += 8   # Starvation
-            effects.append("starvation")
-        elif self.food < 20:
-            health_loss += 3   # Hunger
-            effects.append("hunger")
-            
-        # Hope effects on health
-        if self.hope < 30:
-            health_loss += 2   # Low morale affects physical health
-            effects.append("despair")
+        # Health effects (low hope affects physical health)
+        health_loss, flags = _shortage_effects(self.water, self.food, self.hope < 30,
+                                               self.SHORTAGE_PENALTIES)
             
         # Apply health loss
         if health_loss > 0:
             self.health = max(0, self.health - health_loss)
             
         # Generate status message
-        if not effects:
+        if not flags:
             return f"{self.name} is doing well."
         
-        if health_loss > 15:
-            return f"{self.name} is severely weakened by {' and '.join(effects)}."
-        elif health_loss > 0:
-            return f"{self.name} is suffering from {' and '.join(effects)}."
-        else:
-            return f"{self.name} is experiencing {' and '.join(effects)}."
+        tier = bisect.bisect_left(self.SEVERITY_TIERS, health_loss)
+        return _shortage_message(type(self), flags, tier).format(self.name)
     
     def change_hope(self, amount):
         """Change the character's hope level.
@@ -181,20 +351,8 @@ class Migrant(Character):
             self.trauma = max(0, self.trauma - trauma_recovery)
         
         # Hope messages based on direction and magnitude
-        if change > 20:
-            return f"{self.name} feels a powerful surge of hope."
-        elif change > 10:
-            return f"{self.name} feels significantly more hopeful."
-        elif change > 0:
-            return f"{self.name} feels a bit more hopeful."
-        elif change < -20:
-            return f"{self.name} feels overwhelmed by despair."
-        elif change < -10:
-            return f"{self.name}'s hope diminishes significantly."
-        elif change < 0:
-            return f"{self.name} feels slightly less hopeful."
-        else:
-            return f"{self.name}'s hope remains unchanged."
+        messages = _HOPE_GAIN_MESSAGES if change > 0 else _HOPE_LOSS_MESSAGES
+        return messages[bisect.bisect_left(_HOPE_CHANGE_TIERS, abs(change))].format(self.name)
     
     def add_family_tie(self, name, relationship):
         """Add a family member with their relationship.
@@ -207,6 +365,7 @@ class Migrant(Character):
             str: Description of added family tie
         """
         self.family_ties.append({"name": name, "relationship": relationship})
+        self._desc_version += 1
         return f"{self.name} thinks of {name}, their {relationship}."
     
     def improve_skill(self, amount=1):
@@ -249,6 +408,24 @@ class Migrant(Character):
 class BorderPatrol(Character):
     """Class representing a border patrol agent."""
     
+    __slots__ = ("years_of_service", "moral_compass", "stress", "encounters", "money", "water",
+                 "food", "experience", "department_standing")
+    
+    STATS = Character.STATS | {"moral_compass", "stress", "money", "water", "food", "experience",
+                               "department_standing"}
+    
+    # Health loss and names for severe/mild thirst, hunger and job stress
+    SHORTAGE_PENALTIES = (5, 2, 4, 1, 2)
+    SHORTAGE_EFFECTS = ("severe dehydration", "thirst", "hunger", "mild hunger", "stress")
+    
+    # Patrols consume resources at a slower rate and are less affected by the desert
+    BASE_CONSUMPTION = (3, 3)
+    DESERT_CONSUMPTION = (3, 1)
+    # Status message for health loss of 0, up to 10, and above 10
+    SEVERITY_TIERS = (0, 10)
+    SEVERITY_MESSAGES = ("{} is experiencing {}.", "{} is dealing with {}.",
+                         "{} is significantly affected by {}.")
+    
     def __init__(self, name, description, years_of_service=0, health=100):
         """Initialize a border patrol agent character.
         
@@ -269,22 +446,18 @@ class BorderPatrol(Character):
         self.experience = years_of_service * 10  # Experience level (0-100)
         self.department_standing = 50  # Standing within the organization (0-100)
         
-    def describe(self):
-        """Return a detailed description of the agent."""
-        base_desc = super().describe()
+    def _describe_key(self):
+        """Include the reputation tier, since standing is also changed directly."""
+        return (self._desc_version, bisect.bisect_right(_STANDING_TIERS, self.department_standing))
+    
+    def _render_description(self):
+        """Build a detailed description of the agent."""
+        base_desc = super()._render_description()
         detailed_desc = f"{base_desc}\nYears of Service: {self.years_of_service}"
         
         # Add reputation description
-        if self.department_standing >= 80:
-            detailed_desc += "\nYou're highly respected within the department."
-        elif self.department_standing >= 60:
-            detailed_desc += "\nYou have a good reputation among your colleagues."
-        elif self.department_standing >= 40:
-            detailed_desc += "\nYour standing in the department is average."
-        elif self.department_standing >= 20:
-            detailed_desc += "\nSome colleagues question your commitment to the job."
-        else:
-            detailed_desc += "\nYour reputation within the department has suffered."
+        tier = bisect.bisect_right(_STANDING_TIERS, self.department_standing)
+        detailed_desc += f"\n{_STANDING_DESCRIPTIONS[tier]}"
             
         return detailed_desc
     
@@ -301,9 +474,7 @@ class BorderPatrol(Character):
         self.encounters += 1
         
         # Stress increase depends on experience
-        base_stress = random.randint(1, 10)
-        experience_factor = max(0.2, 1.0 - (self.experience / 120))  # Experience reduces stress
-        stress_increase = int(base_stress * experience_factor)
+        stress_increase = _stress_increase(random.randint(1, 10), self.experience)
         self.stress = min(100, self.stress + stress_increase)
         
         # Different actions affect moral compass and department standing
@@ -344,17 +515,9 @@ class BorderPatrol(Character):
         Returns:
             str: Description of stress effects
         """
-        effects = []
-        
         # Determine stress effects
-        if self.stress > 80:
-            self.health -= 5
-            effects.append("severe burnout")
-        elif self.stress > 60:
-            self.health -= 2
-            effects.append("trouble sleeping")
-        elif self.stress > 40:
-            effects.append("preoccupation with work")
+        health_cost, effect = _STRESS_EFFECTS[bisect.bisect_left(_STRESS_TIERS, self.stress)]
+        self.health -= health_cost
             
         # Stress recovery if below threshold
         if self.stress < 30:
@@ -362,10 +525,10 @@ class BorderPatrol(Character):
             return f"{self.name} is managing work stress well."
             
         # Generate status message
-        if not effects:
+        if effect is None:
             return f"{self.name} is coping with the job's demands."
             
-        return f"{self.name} is experiencing {' and '.join(effects)} due to job stress."
+        return f"{self.name} is experiencing {effect} due to job stress."
     
     def consume_resources(self, water_amount=3, food_amount=3):
         """Consume water and food resources (slower than migrants).
@@ -377,55 +540,24 @@ class BorderPatrol(Character):
         Returns:
             str: Description of resource consumption effects
         """
-        # Experience helps with resource management
-        if self.experience > 0:
-            experience_factor = 1.0 - (self.experience / 200)  # Max 50% reduction
-            water_amount = max(1, int(water_amount * experience_factor))
-            food_amount = max(1, int(food_amount * experience_factor))
-        
-        # Consume resources
-        self.water = max(0, self.water - water_amount)
-        self.food = max(0, self.food - food_amount)
+        # Experience helps with resource management (max 50% reduction)
+        self.water, self.food = _deplete(self.water, self.food, water_amount, food_amount,
+                                         self.experience)
         
-        # Health effects
-        health_loss = 0
-        effects = []
-        
-        # Water effects
-        if self.water <= 0:
-            health_loss += 5  # Less severe than migrants
-            effects.append("severe dehydration")
-        elif self.water < 20:
-            health_loss += 2
-            effects.append("thirst")
-            
-        # Food effects
-        if self.food <= 0:
-            health_loss += 4
-            effects.append("hunger")
-        elif self.food < 20:
-            health_loss += 1
-            effects.append("mild hunger")
-            
-        # Stress effects on health
-        if self.stress > 70:
-            health_loss += 2
-            effects.append("stress")
+        # Health effects (less severe than migrants, but stress takes a toll)
+        health_loss, flags = _shortage_effects(self.water, self.food, self.stress > 70,
+                                               self.SHORTAGE_PENALTIES)
             
         # Apply health loss
         if health_loss > 0:
             self.health = max(0, self.health - health_loss)
             
         # Generate status message
-        if not effects:
+        if not flags:
             return f"{self.name} is doing well."
         
-        if health_loss > 10:
-            return f"{self.name} is significantly affected by {' and '.join(effects)}."
-        elif health_loss > 0:
-            return f"{self.name} is dealing with {' and '.join(effects)}."
-        else:
-            return f"{self.name} is experiencing {' and '.join(effects)}."
+        tier = bisect.bisect_left(self.SEVERITY_TIERS, health_loss)
+        return _shortage_message(type(self), flags, tier).format(self.name)
     
     def modify_standing(self, amount):
         """Modify department standing.
@@ -440,13 +572,5 @@ class BorderPatrol(Character):
         self.department_standing = max(0, min(100, self.department_standing + amount))
         change = self.department_standing - old_standing
         
-        if change > 15:
-            return f"{self.name}'s actions have significantly improved their standing in the department."
-        elif change > 0:
-            return f"{self.name}'s reputation in the department has slightly improved."
-        elif change < -15:
-            return f"{self.name}'s actions have seriously damaged their reputation in the department."
-        elif change < 0:
-            return f"{self.name}'s standing in the department has slightly suffered."
-        else:
-            return f"{self.name}'s departmental standing remains unchanged."
\ No newline at end of file
+        messages = _STANDING_GAIN_MESSAGES if change > 0 else _STANDING_LOSS_MESSAGES
+        return messages[bisect.bisect_left(_STANDING_CHANGE_TIERS, abs(change))].format(self.name)
\ No newline at end of file
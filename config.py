@@ -4,6 +4,8 @@ Configuration module for 'The Line: A Border Journey'
 This module contains global configuration settings for the game.
 """
 
+from types import MappingProxyType
+
 # Game version
 VERSION = "1.0.0"
 
@@ -36,6 +38,12 @@ DIFFICULTY_MODIFIERS = {
         "patrol_intensity": 1.3
     }
 }
+DIFFICULTY_MODIFIERS = MappingProxyType(
+    {level: MappingProxyType(modifiers) for level, modifiers in DIFFICULTY_MODIFIERS.items()}
+)
+
+# Resource consumption modifier for the selected difficulty, resolved once at import
+RESOURCE_CONSUMPTION = DIFFICULTY_MODIFIERS[DIFFICULTY]["resource_consumption"]
 
 # Text display settings
 TEXT_SPEED = 0.001  # Seconds per character in slow printing
@@ -8,35 +8,428 @@ interactions through semantic search.
 * can use smaller embedding models like nomic-embed-text if you would like to run it faster on your device!
 """
 
+import hashlib
 import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import numpy as np
 from typing import List, Dict, Any, Tuple, Optional
 
+try:
+    import orjson  # Optional: parses long float arrays much faster than json
+except ImportError:
+    orjson = None
+
+# (connect, read) timeouts in seconds; the first request may wait for the model to load
+REQUEST_TIMEOUT = (3.0, 60.0)
+
+# Embeddings of every text seen so far, shared across runs and games
+DISK_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "theline", "embeds.sqlite")
+
+# Game commands and the phrasings used to embed them
+COMMAND_DESCRIPTIONS = {
+    "look": "examine surroundings, check environment, see what's around, observe area",
+    "status": "check health, view inventory, see stats, character status, personal condition",
+    "talk": "speak to character, converse with person, chat with npc, communicate",
+    "take": "pick up item, grab object, collect thing, acquire item",
+    "use": "utilize item, employ object, make use of, activate",
+    "move north": "go north, travel northward, head north, walk north",
+    "move south": "go south, travel southward, head south, walk south",
+    "move east": "go east, travel eastward, head east, walk east",
+    "move west": "go west, travel westward, head west, walk west",
+    "help": "show commands, display help, list options, assistance",
+    "quit": "exit game, end session, stop playing, leave game"
+}
+
+
+def _build_command_literals():
+    """Map each command name and each of its listed phrasings to the command."""
+    literals = {command: command for command in COMMAND_DESCRIPTIONS}
+    for command, description in COMMAND_DESCRIPTIONS.items():
+        for phrase in description.split(","):
+            literals.setdefault(phrase.strip(), command)
+    return literals
+
+
+# Exact phrasings that resolve to a command without embedding the input
+COMMAND_LITERALS = _build_command_literals()
+
+
+class EmbeddingIndex:
+    """Normalized embeddings stored as a key list and one (N, D) float32 matrix."""
+    
+    def __init__(self, keys=None, matrix=None):
+        """
+        Initialize an embedding index.
+        
+        Args:
+            keys (List[str]): Key for each row of the matrix
+            matrix (np.ndarray): (N, D) float32 matrix of unit-length embeddings
+        """
+        self.keys = list(keys) if keys else []
+        self.matrix = matrix
+        
+    @classmethod
+    def from_vectors(cls, vectors: Dict[str, np.ndarray]) -> "EmbeddingIndex":
+        """
+        Build an index from a mapping of keys to normalized vectors.
+        
+        Args:
+            vectors (Dict[str, np.ndarray]): Normalized embedding for each key
+            
+        Returns:
+            EmbeddingIndex: Index with the vectors packed into a single matrix
+        """
+        if not vectors:
+            return cls()
+        return cls(vectors.keys(), np.stack(list(vectors.values())).astype(np.float32, copy=False))
+    
+    def __len__(self):
+        """Return the number of indexed embeddings."""
+        return len(self.keys)
+    
+    def best_match(self, query: np.ndarray, threshold: float) -> Tuple[Optional[str], float]:
+        """
+        Score every row against a query with one matrix-vector product.
+        
+        Args:
+            query (np.ndarray): Normalized query vector
+            threshold (float): Minimum similarity threshold to consider a match
+            
+        Returns:
+            Tuple[str, float]: Best matching key and similarity score, or (None, 0)
+        """
+        if not self.keys:
+            return None, 0
+        
+        scores = self.matrix @ query
+        best = int(scores.argmax())
+        best_score = float(scores[best])
+        
+        if best_score >= threshold:
+            return self.keys[best], best_score
+        return None, 0
+
+
+# Categories of game content that can be matched against user input
+INDEX_CATEGORIES = ("command", "location", "character", "item")
+
+
+def _lazy_index(category: str) -> property:
+    """
+    Create a property returning a category's index, embedding it on first use.
+    
+    Args:
+        category (str): One of INDEX_CATEGORIES
+        
+    Returns:
+        property: Read-only EmbeddingIndex property
+    """
+    return property(lambda self: self._get_index(category),
+                    doc=f"EmbeddingIndex of {category} embeddings, built on first use.")
 
 
 class EmbeddingsEngine:
     """Handles embeddings generation and semantic search using Ollama's API."""
     
-    def __init__(self, model_name="mxbai-embed-large", api_url="http://localhost:11434/api/embeddings"):
+    def __init__(self, model_name="mxbai-embed-large", api_url="http://localhost:11434/api/embeddings",
+                 cache_size=2000, batch_api_url=None):
         """
         Initialize the embeddings engine.
         
         Args:
             model_name (str): Name of the embedding model to use
             api_url (str): URL of the Ollama API endpoint
+            cache_size (int): Maximum number of embeddings kept in memory
+            batch_api_url (str): URL of Ollama's batched /api/embed endpoint
+                (default: derived from api_url)
         """
         self.model_name = model_name
         self.api_url = api_url
-        self.command_embeddings = {}
-        self.location_embeddings = {}
-        self.character_embeddings = {}
-        self.item_embeddings = {}
+        if batch_api_url is None and api_url.endswith("/api/embeddings"):
+            batch_api_url = api_url[:-len("/api/embeddings")] + "/api/embed"
+        self.batch_api_url = batch_api_url
+        self._session = self._create_session()
+        # Cleared after the first failed connection, so later lookups skip Ollama
+        self.available = True
+        self.cache_size = cache_size
+        # Embeddings persisted across runs; None disables the disk cache
+        self.disk_cache_path = DISK_CACHE_PATH
+        self._disk_cache = None
+        self._disk_lock = threading.Lock()
+        # LRU cache of raw embeddings, keyed by (model, text)
+        self._embedding_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # LRU cache of normalized query vectors, keyed by the whitespace-collapsed input
+        self._query_cache = OrderedDict()
+        self.query_cache_size = 128
+        # Built indexes by category, and (keys, descriptions) still to be embedded
+        self._indexes = {category: EmbeddingIndex() for category in INDEX_CATEGORIES}
+        self._pending = {}
         
-    def get_embedding(self, text: str) -> Optional[List[float]]:
+    command_embeddings = _lazy_index("command")
+    location_embeddings = _lazy_index("location")
+    character_embeddings = _lazy_index("character")
+    item_embeddings = _lazy_index("item")
+    
+    def _create_session(self) -> requests.Session:
+        """
+        Create an HTTP session that keeps connections to Ollama alive.
+        
+        Requests are retried when Ollama reports a temporary server error,
+        such as while a model is still loading. Refused connections are not
+        retried, so the game starts promptly when Ollama isn't running.
+        
+        Returns:
+            requests.Session: Configured session
+        """
+        retry = Retry(total=3, connect=0, backoff_factor=0.2,
+                      status_forcelist=(500, 502, 503, 504),
+                      allowed_methods=frozenset({"POST"}), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
+    def get_embedding(self, text: str) -> Optional[np.ndarray]:
         """
         Get embedding vector for a text using Ollama's API.
         
+        Results are kept in an in-memory LRU cache and in the disk cache, so
+        repeated texts such as common commands only cost one request ever.
+        
+        Args:
+            text (str): Text to embed
+            
+        Returns:
+            np.ndarray or None: Read-only float32 embedding or None if request failed
+        """
+        cached = self._get_cached(text)
+        if cached is not None or not self.available:
+            return cached
+        
+        vector = self._cache_embedding(text, self._request_embedding(text))
+        if vector is not None:
+            self._store_on_disk([(text, vector)])
+        return vector
+    
+    def get_embeddings_batch(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """
+        Get embedding vectors for several texts with as few requests as possible.
+        
+        Texts in neither cache are sent to Ollama's /api/embed endpoint in one request.
+        If that endpoint is unavailable (older Ollama versions), texts are
+        embedded individually over a few concurrent requests instead. Once
+        Ollama could not be reached, only cached embeddings are returned.
+        
+        Args:
+            texts (List[str]): Texts to embed
+            
+        Returns:
+            List[np.ndarray or None]: Embeddings in the same order as texts
+        """
+        missing = [text for text in dict.fromkeys(texts) if self._get_cached(text) is None]
+        fetched = {}
+        if missing and self.batch_api_url and self.available:
+            embeddings = self._request_embeddings(missing)
+            if embeddings is not None:
+                fetched = {text: self._cache_embedding(text, embedding)
+                           for text, embedding in zip(missing, embeddings)}
+                self._store_on_disk([item for item in fetched.items() if item[1] is not None])
+        if missing and not fetched and self.available:
+            fetched = dict(zip(missing, self._embed_many(missing)))
+        
+        return [fetched[text] if text in fetched else self.get_embedding(text) for text in texts]
+    
+    def _embed_many(self, texts: List[str], max_workers: int = 4) -> List[Optional[np.ndarray]]:
+        """
+        Embed texts one per request, overlapping the requests in a thread pool.
+        
+        Args:
+            texts (List[str]): Texts to embed
+            max_workers (int): Maximum number of concurrent requests
+            
+        Returns:
+            List[np.ndarray or None]: Embeddings in the same order as texts
+        """
+        if len(texts) == 1:
+            return [self.get_embedding(texts[0])]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.get_embedding, texts))
+    
+    def _get_cached(self, text: str) -> Optional[np.ndarray]:
+        """
+        Look up an embedding in the LRU cache, then in the disk cache.
+        
+        Args:
+            text (str): Text that was embedded
+            
+        Returns:
+            np.ndarray or None: Read-only float32 embedding or None if not cached
+        """
+        key = (self.model_name, text)
+        with self._cache_lock:
+            cached = self._embedding_cache.get(key)
+            if cached is not None:
+                self._embedding_cache.move_to_end(key)
+                return cached
+        
+        return self._cache_embedding(text, self._load_from_disk(text))
+    
+    def close(self):
+        """Close the disk cache and the HTTP session."""
+        with self._disk_lock:
+            if self._disk_cache is not None:
+                self._disk_cache.close()
+                self._disk_cache = None
+        self._session.close()
+    
+    def __del__(self):
+        """Close open connections when the engine is garbage collected."""
+        if getattr(self, "_disk_cache", None) is not None:
+            self.close()
+    
+    def _disk_key(self, text: str) -> bytes:
+        """Return the disk cache key of a text for the current model."""
+        return hashlib.sha256(f"{self.model_name}\0{text}".encode("utf-8")).digest()
+    
+    def _open_disk_cache(self) -> Optional[sqlite3.Connection]:
+        """
+        Open the disk cache on first use. Call with _disk_lock held.
+        
+        Returns:
+            sqlite3.Connection or None: Cache database, or None if disabled or unavailable
+        """
+        if self._disk_cache is None and self.disk_cache_path:
+            try:
+                os.makedirs(os.path.dirname(self.disk_cache_path), exist_ok=True)
+                connection = sqlite3.connect(self.disk_cache_path, check_same_thread=False)
+                connection.execute("CREATE TABLE IF NOT EXISTS embeds (key BLOB PRIMARY KEY, vec BLOB)")
+                self._disk_cache = connection
+            except (OSError, sqlite3.Error) as e:
+                print(f"Could not open embeddings cache: {e}")
+                self.disk_cache_path = None
+        return self._disk_cache
+    
+    def _load_from_disk(self, text: str) -> Optional[np.ndarray]:
+        """
+        Load an embedding saved by an earlier run.
+        
+        Args:
+            text (str): Text that was embedded
+            
+        Returns:
+            np.ndarray or None: Float32 embedding or None if not on disk
+        """
+        with self._disk_lock:
+            connection = self._open_disk_cache()
+            if connection is None:
+                return None
+            try:
+                row = connection.execute("SELECT vec FROM embeds WHERE key = ?",
+                                         (self._disk_key(text),)).fetchone()
+            except sqlite3.Error:
+                return None
+        return np.frombuffer(row[0], dtype=np.float32) if row else None
+    
+    def _store_on_disk(self, items: List[Tuple[str, np.ndarray]]):
+        """
+        Save fetched embeddings to the disk cache in one transaction.
+        
+        Args:
+            items (List[Tuple[str, np.ndarray]]): (text, float32 embedding) pairs
+        """
+        if not items:
+            return
+        with self._disk_lock:
+            connection = self._open_disk_cache()
+            if connection is None:
+                return
+            try:
+                with connection:
+                    connection.executemany("INSERT OR REPLACE INTO embeds (key, vec) VALUES (?, ?)",
+                                           [(self._disk_key(text), vector.tobytes()) for text, vector in items])
+            except sqlite3.Error as e:
+                print(f"Could not save embeddings cache: {e}")
+    
+    def _cache_embedding(self, text: str, embedding: Optional[List[float]]) -> Optional[np.ndarray]:
+        """
+        Store a fetched embedding in the LRU cache.
+        
+        Args:
+            text (str): Text that was embedded
+            embedding (List[float]): Embedding vector returned by the API, or None
+            
+        Returns:
+            np.ndarray or None: Read-only float32 embedding or None if missing
+        """
+        if embedding is None or len(embedding) == 0:
+            return None
+        vector = np.asarray(embedding, dtype=np.float32)
+        vector.flags.writeable = False
+        with self._cache_lock:
+            self._embedding_cache[(self.model_name, text)] = vector
+            if len(self._embedding_cache) > self.cache_size:
+                self._embedding_cache.popitem(last=False)
+        return vector
+    
+    def _parse_json(self, response: requests.Response) -> Dict[str, Any]:
+        """
+        Parse an Ollama response body, using orjson when it is installed.
+        
+        Args:
+            response (requests.Response): Successful API response
+            
+        Returns:
+            Dict[str, Any]: Decoded JSON object
+        """
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return json.loads(response.content)
+    
+    def _request_embeddings(self, texts: List[str]) -> Optional[List[List[float]]]:
+        """
+        Request embedding vectors for several texts from Ollama's /api/embed.
+        
+        Args:
+            texts (List[str]): Texts to embed
+            
+        Returns:
+            List[List[float]] or None: Embedding vectors or None if the batch failed
+        """
+        try:
+            payload = {
+                "model": self.model_name,
+                "input": texts
+            }
+            response = self._session.post(self.batch_api_url, json=payload, timeout=REQUEST_TIMEOUT)
+            
+            if response.status_code == 200:
+                embeddings = self._parse_json(response).get("embeddings")
+                if embeddings and len(embeddings) == len(texts):
+                    return embeddings
+            elif response.status_code != 404:
+                print(f"Error getting batch embeddings: {response.status_code}")
+            return None
+        except (requests.ConnectionError, requests.Timeout) as e:
+            self._mark_unavailable(e)
+            return None
+        except Exception as e:
+            print(f"Exception when calling Ollama API: {e}")
+            return None
+    
+    def _request_embedding(self, text: str) -> Optional[List[float]]:
+        """
+        Request an embedding vector for a text from Ollama's API.
+        
         Args:
             text (str): Text to embed
             
@@ -48,65 +441,168 @@ class EmbeddingsEngine:
                 "model": self.model_name,
                 "prompt": text
             }
-            response = requests.post(self.api_url, json=payload)
+            response = self._session.post(self.api_url, json=payload, timeout=REQUEST_TIMEOUT)
             
             if response.status_code == 200:
-                result = response.json()
+                result = self._parse_json(response)
                 return result.get("embedding")
             else:
                 print(f"Error getting embedding: {response.status_code}")
                 print(f"Response: {response.text}")
                 return None
+        except (requests.ConnectionError, requests.Timeout) as e:
+            self._mark_unavailable(e)
+            return None
         except Exception as e:
             print(f"Exception when calling Ollama API: {e}")
             return None
     
-    def cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
+    def _mark_unavailable(self, error: Exception):
+        """
+        Stop calling Ollama after it could not be reached.
+        
+        Later lookups return no match, so the game uses its keyword parser
+        instead of retrying and printing an error every turn.
+        
+        Args:
+            error (Exception): Connection error raised by the request
+        """
+        print(f"Exception when calling Ollama API: {error}")
+        print("Game will fall back to basic command processing.")
+        self.available = False
+    
+    def normalize(self, embedding: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        """
+        Convert an embedding to a unit-length float32 vector.
+        
+        Stored and query vectors are normalized once so that comparing them
+        only needs a dot product.
+        
+        Args:
+            embedding (np.ndarray): Raw embedding vector, or None
+            
+        Returns:
+            np.ndarray or None: Normalized vector or None if missing or zero length
+        """
+        if embedding is None:
+            return None
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return None
+        return vector / norm
+    
+    def _get_query_embedding(self, user_input: str) -> Optional[np.ndarray]:
+        """
+        Get the normalized embedding of a user input, reusing recent queries.
+        
+        A single command is often matched against several categories in the
+        same turn, and players repeat the same commands, so the normalized
+        vector is kept for the next lookup. Inputs that differ only in spacing
+        share one entry, and the whitespace-collapsed text is what gets
+        embedded. Case is kept because it can change the embedding.
+        
+        Args:
+            user_input (str): User's input text
+            
+        Returns:
+            np.ndarray or None: Normalized query vector or None if embedding failed
+        """
+        if not self.available:
+            return None
+        key = " ".join(user_input.split())
+        query = self._query_cache.get(key)
+        if query is not None:
+            self._query_cache.move_to_end(key)
+            return query
+        
+        query = self.normalize(self.get_embedding(key))
+        if query is not None:
+            query.flags.writeable = False
+            self._query_cache[key] = query
+            if len(self._query_cache) > self.query_cache_size:
+                self._query_cache.popitem(last=False)
+        return query
+    
+    def cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
         """
         Calculate cosine similarity between two vectors.
         
         Args:
-            vec1 (List[float]): First vector
-            vec2 (List[float]): Second vector
+            vec1 (np.ndarray): First vector (lists are converted)
+            vec2 (np.ndarray): Second vector (lists are converted)
             
         Returns:
             float: Cosine similarity (-1 to 1, higher is more similar)
         """
-        vec1 = np.array(vec1)
-        vec2 = np.array(vec2)
-        return np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2))
+        # No copy is made for the float32 arrays this engine produces
+        vec1 = np.asarray(vec1, dtype=np.float32)
+        vec2 = np.asarray(vec2, dtype=np.float32)
+        return float(np.vdot(vec1, vec2) / np.sqrt(np.vdot(vec1, vec1) * np.vdot(vec2, vec2)))
     
     def initialize_command_embeddings(self):
         """
         Initialize embeddings for standard game commands.
+        
+        Descriptions are embedded when commands are first searched.
         """
-        commands = {
-            "look": "examine surroundings, check environment, see what's around, observe area",
-            "status": "check health, view inventory, see stats, character status, personal condition",
-            "talk": "speak to character, converse with person, chat with npc, communicate",
-            "take": "pick up item, grab object, collect thing, acquire item",
-            "use": "utilize item, employ object, make use of, activate",
-            "move north": "go north, travel northward, head north, walk north",
-            "move south": "go south, travel southward, head south, walk south",
-            "move east": "go east, travel eastward, head east, walk east",
-            "move west": "go west, travel westward, head west, walk west",
-            "help": "show commands, display help, list options, assistance",
-            "quit": "exit game, end session, stop playing, leave game"
-        }
+        self._defer("command", list(COMMAND_DESCRIPTIONS), list(COMMAND_DESCRIPTIONS.values()))
+    
+    def _defer(self, category: str, keys: List[str], descriptions: List[str]):
+        """
+        Record descriptions to embed the first time a category is searched.
         
-        for cmd, description in commands.items():
-            embedding = self.get_embedding(description)
-            if embedding:
-                self.command_embeddings[cmd] = embedding
+        Args:
+            category (str): One of INDEX_CATEGORIES
+            keys (List[str]): Key for each description
+            descriptions (List[str]): Texts to embed
+        """
+        self._pending[category] = (keys, descriptions)
+    
+    def _get_index(self, category: str) -> EmbeddingIndex:
+        """
+        Return a category's index, embedding pending descriptions first.
+        
+        The first search embeds every category still pending in one request,
+        so later searches of other categories need no request mid-turn.
+        
+        Args:
+            category (str): One of INDEX_CATEGORIES
+            
+        Returns:
+            EmbeddingIndex: Index of the category
+        """
+        if category in self._pending:
+            self._embed_pending()
+        return self._indexes[category]
+    
+    def _embed_pending(self):
+        """
+        Embed the pending descriptions of every category in one batch.
+        
+        Nothing is embedded once Ollama could not be reached, so searches
+        during the game do not retry the failed requests.
+        """
+        if not self.available or not self._pending:
+            return
+        pending = list(self._pending.items())
+        self._pending.clear()
+        embeddings = iter(self.get_embeddings_batch(
+            [description for _, (_, descriptions) in pending for description in descriptions]))
+        for category, (keys, descriptions) in pending:
+            self._indexes[category] = self._index_embeddings(keys, list(islice(embeddings, len(descriptions))))
     
     def initialize_location_embeddings(self, locations):
         """
         Initialize embeddings for game locations.
         
+        Descriptions are embedded when locations are first searched.
+        
         Args:
             locations (dict): Dictionary of location objects
         """
-        for location_id, location in locations.items():
+        descriptions = []
+        for location in locations.values():
             # Create rich description for embedding
             description = f"{location.name}: {location.description}"
             
@@ -119,18 +615,20 @@ class EmbeddingsEngine:
                 description += f" Settlement with population of approximately {location.population}."
                 if hasattr(location, 'services') and location.services:
                     description += f" Services available: {', '.join(location.services)}."
-            
-            embedding = self.get_embedding(description)
-            if embedding:
-                self.location_embeddings[location_id] = embedding
+            descriptions.append(description)
+        
+        self._defer("location", list(locations), descriptions)
     
     def initialize_character_embeddings(self, characters):
         """
         Initialize embeddings for game characters.
         
+        Descriptions are embedded when characters are first searched.
+        
         Args:
             characters (list): List of character objects
         """
+        descriptions = []
         for character in characters:
             # Create rich description for embedding
             description = f"{character.name}: {character.description}"
@@ -140,15 +638,17 @@ class EmbeddingsEngine:
                 description += f" From {character.origin}. Motivation: {character.motivation}."
             if hasattr(character, 'years_of_service'):
                 description += f" {character.years_of_service} years of service in border patrol."
-            
-            embedding = self.get_embedding(description)
-            if embedding:
-                self.character_embeddings[character.name.lower()] = embedding
+            descriptions.append(description)
+        
+        names = [character.name.lower() for character in characters]
+        self._defer("character", names, descriptions)
     
     def initialize_item_embeddings(self, items):
         """
         Initialize embeddings for game items.
         
+        Descriptions are embedded when items are first searched.
+        
         Args:
             items (list): List of item names
         """
@@ -165,12 +665,28 @@ class EmbeddingsEngine:
             "id papers": "identification documents, passport, legal papers"
         }
         
-        for item in items:
-            item_lower = item.lower()
-            description = item_descriptions.get(item_lower, item)
-            embedding = self.get_embedding(description)
-            if embedding:
-                self.item_embeddings[item_lower] = embedding
+        names = [item.lower() for item in items]
+        descriptions = [item_descriptions.get(name, item) for name, item in zip(names, items)]
+        self._defer("item", names, descriptions)
+    
+    def _index_embeddings(self, keys: List[str],
+                          embeddings: List[Optional[np.ndarray]]) -> EmbeddingIndex:
+        """
+        Normalize embeddings and index them under their keys.
+        
+        Args:
+            keys (List[str]): Key for each embedding
+            embeddings (List[np.ndarray or None]): Raw embeddings, None where embedding failed
+            
+        Returns:
+            EmbeddingIndex: Index of the embeddings that could be normalized
+        """
+        vectors = {}
+        for key, embedding in zip(keys, embeddings):
+            embedding = self.normalize(embedding)
+            if embedding is not None:
+                vectors[key] = embedding
+        return EmbeddingIndex.from_vectors(vectors)
     
     def find_best_command(self, user_input: str, threshold: float = 0.7) -> Tuple[Optional[str], float]:
         """
@@ -185,56 +701,39 @@ class EmbeddingsEngine:
         """
         if not self.command_embeddings:
             return None, 0
+        
+        # Literal commands and synonyms need no embedding
+        literal = COMMAND_LITERALS.get(" ".join(user_input.lower().split()))
+        if literal:
+            return literal, 1.0
             
-        input_embedding = self.get_embedding(user_input)
-        if not input_embedding:
+        query = self._get_query_embedding(user_input)
+        if query is None:
             return None, 0
             
-        best_command = None
-        best_score = 0
-        
-        for command, cmd_embedding in self.command_embeddings.items():
-            similarity = self.cosine_similarity(input_embedding, cmd_embedding)
-            if similarity > best_score:
-                best_score = similarity
-                best_command = command
-        
-        if best_score >= threshold:
-            return best_command, best_score
-        return None, 0
+        return self.command_embeddings.best_match(query, threshold)
     
-    def find_best_match(self, user_input: str, embedding_dict: Dict[str, List[float]], 
+    def find_best_match(self, user_input: str, index: EmbeddingIndex, 
                        threshold: float = 0.7) -> Tuple[Optional[str], float]:
         """
         Find the best matching entity for user input using semantic similarity.
         
         Args:
             user_input (str): User's input text
-            embedding_dict (Dict[str, List[float]]): Dictionary of entity embeddings
+            index (EmbeddingIndex): Index of entity embeddings
             threshold (float): Minimum similarity threshold to consider a match
             
         Returns:
             Tuple[str, float]: Best matching entity and similarity score, or (None, 0)
         """
-        if not embedding_dict:
+        if not index:
             return None, 0
             
-        input_embedding = self.get_embedding(user_input)
-        if not input_embedding:
+        query = self._get_query_embedding(user_input)
+        if query is None:
             return None, 0
             
-        best_entity = None
-        best_score = 0
-        
-        for entity, entity_embedding in embedding_dict.items():
-            similarity = self.cosine_similarity(input_embedding, entity_embedding)
-            if similarity > best_score:
-                best_score = similarity
-                best_entity = entity
-        
-        if best_score >= threshold:
-            return best_entity, best_score
-        return None, 0
+        return index.best_match(query, threshold)
     
     def find_best_location(self, description: str) -> Tuple[Optional[str], float]:
         """
@@ -6,11 +6,164 @@ representing key moments and challenges from 'The Line Becomes a River'.
 """
 
 import random
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+
+from location import Border, Desert, Settlement
+
+# Functions of the global random source, bound once for the execute() paths;
+# random.seed() still makes event outcomes reproducible
+_choice = random.choice
+_random = random.random
+
+# Character stats kept in the 0-100 range that choice consequences may change
+_CLAMPED_STATS = frozenset({'hope', 'health', 'water', 'food', 'moral_compass', 'stress'})
+
+
+def _clamp100(value):
+    """Clamp a stat value to the 0-100 range."""
+    return 0 if value < 0 else 100 if value > 100 else value
+
+
+def _apply_stat(character, stat, delta):
+    """Add delta to a 0-100 character stat and return how much it actually changed.
+    
+    Args:
+        character: Character that has the stat
+        stat (str): Name of the stat attribute
+        delta (int): Amount to add (negative to subtract)
+        
+    Returns:
+        int: Change after clamping
+    """
+    old = getattr(character, stat)
+    new = _clamp100(old + delta)
+    setattr(character, stat, new)
+    return new - old
+
+
+def _format_change(label, change):
+    """Format a nonzero stat change as a signed report line, e.g. "Water: +5"."""
+    return f"\n{label}: {change:+}"
+
+
+# Moral choice consequence keys: (consequence key, stat, report name), in report order
+_MORAL_IMPACTS = (
+    ('moral_impact', 'moral_compass', 'moral'),
+    ('stress_impact', 'stress', 'stress'),
+    ('hope_impact', 'hope', 'hope'),
+    ('trauma_impact', 'trauma', 'trauma'),
+    ('health_impact', 'health', 'health'),
+)
+
+# Immediate weather effects: (effects key, stat, report label)
+_WEATHER_IMMEDIATE_EFFECTS = (
+    ('immediate_water', 'water', 'Water'),
+    ('immediate_health', 'health', 'Health'),
+)
+
+# Weather effects that change the current location's environment
+_WEATHER_ENVIRONMENT_KEYS = ('visibility', 'terrain', 'temperature')
+
+# Report labels of the stats a trauma event's custom impacts may change
+_TRAUMA_IMPACT_LABELS = {'health': 'Health', 'stress': 'Stress'}
+
+
+def _share_mapping(mapping, shared):
+    """Return a shared, read-only copy of a consequence mapping.
+    
+    Nested dicts such as impacts and flags are shared too, so events built
+    with the same shared dict point at the same objects for identical consequences.
+    
+    Args:
+        mapping (dict): Consequence mapping
+        shared (dict): Read-only mappings already made, keyed by their contents
+        
+    Returns:
+        MappingProxyType: Read-only view of an equal mapping
+    """
+    items = tuple((key, _share_mapping(value, shared) if isinstance(value, dict) else value)
+                  for key, value in mapping.items())
+    # Shared nested mappings are unhashable, so they are keyed by identity
+    signature = tuple((key, id(value) if isinstance(value, MappingProxyType) else value)
+                      for key, value in items)
+    try:
+        proxy = shared.get(signature)
+    except TypeError:
+        return MappingProxyType(dict(items))
+    if proxy is None:
+        proxy = shared[signature] = MappingProxyType(dict(items))
+    return proxy
+
+
+def _resource_success_chance(difficulty, survival_skills=None):
+    """Return the percent chance of overcoming a resource event's difficulty.
+    
+    Args:
+        difficulty (int): Difficulty level to overcome (0-100)
+        survival_skills (int): Character's survival skills, or None if they have none
+        
+    Returns:
+        int: Success chance between 10 and 90
+    """
+    if survival_skills is not None:
+        return min(90, max(10, survival_skills - difficulty + 50))
+    return min(90, max(10, 100 - difficulty))
+
+
+def _prompt_index(prompt, count, valid_mask=None, range_message=None,
+                  number_message="Please enter a valid number.",
+                  unavailable_message="You don't meet the requirements for that method. Choose another."):
+    """Ask the player to pick one of several numbered options until the answer is valid.
+    
+    Args:
+        prompt (str): Text shown when asking for input
+        count (int): Number of options
+        valid_mask (int): Bit i is set when option i may be chosen (None allows all)
+        range_message (str): Shown for numbers outside 1-count
+        number_message (str): Shown when the input is not a number
+        unavailable_message (str): Shown for options missing from valid_mask
+        
+    Returns:
+        int: Zero-based index of the chosen option
+    """
+    if range_message is None:
+        range_message = f"Please enter a number between 1 and {count}."
+    while True:
+        try:
+            index = int(input(prompt)) - 1
+        except ValueError:
+            print(number_message)
+            continue
+        if not 0 <= index < count:
+            print(range_message)
+        elif valid_mask is not None and not valid_mask & (1 << index):
+            print(unavailable_message)
+        else:
+            return index
+
+# Messages for resources stored as a 0-100 character stat of the same name:
+# (gained, lost, lost despite a failed attempt to protect supplies)
+_STAT_RESOURCE_MESSAGES = {
+    'water': ("{name} found water (+{change} water).",
+              "{name} lost water ({change} water).",
+              "Despite efforts to protect supplies, {name} lost {loss} water."),
+    'food': ("{name} found food (+{change} food).",
+             "{name} lost food ({change} food).",
+             "Despite efforts to protect supplies, {name} lost {loss} food."),
+    'health': ("{name}'s health improved (+{change} health).",
+               "{name}'s health worsened ({change} health).",
+               "{name} was injured, losing {loss} health."),
+}
 
 
 class Event:
     """Base class for all game events."""
     
+    __slots__ = ("name", "description", "location_types", "required_flags", "excluded_flags",
+                 "_required_items", "_excluded_items", "time_of_day")
+    
     def __init__(self, name, description, location_types=None, required_flags=None, 
                  excluded_flags=None, time_of_day=None):
         """
@@ -26,10 +179,13 @@ class Event:
         """
         self.name = name
         self.description = description
-        self.location_types = location_types or []
+        # Stored as a tuple so isinstance can check every type in one call
+        self.location_types = tuple(location_types or ())
         self.required_flags = required_flags or {}
         self.excluded_flags = excluded_flags or {}
-        self.time_of_day = time_of_day or ["dawn", "day", "dusk", "night"]
+        self._required_items = tuple(self.required_flags.items())
+        self._excluded_items = tuple(self.excluded_flags.items())
+        self.time_of_day = frozenset(time_of_day or ("dawn", "day", "dusk", "night"))
         
     def can_occur(self, location):
         """Check if this event can occur at the given location.
@@ -41,7 +197,7 @@ class Event:
             bool: True if event can occur at location, False otherwise
         """
         # Check location type
-        if self.location_types and not any(isinstance(location, t) for t in self.location_types):
+        if self.location_types and not isinstance(location, self.location_types):
             return False
             
         # Check time of day if location has time attribute
@@ -59,14 +215,18 @@ class Event:
         Returns:
             bool: True if character meets requirements, False otherwise
         """
+        flags = getattr(character, 'story_flags', None)
+        if flags is None:
+            return not self._required_items
+        
         # Check required flags
-        for flag, value in self.required_flags.items():
-            if not hasattr(character, 'story_flags') or character.story_flags.get(flag) != value:
+        for flag, value in self._required_items:
+            if flags.get(flag) != value:
                 return False
                 
         # Check excluded flags
-        for flag, value in self.excluded_flags.items():
-            if hasattr(character, 'story_flags') and character.story_flags.get(flag) == value:
+        for flag, value in self._excluded_items:
+            if flags.get(flag) == value:
                 return False
                 
         return True
@@ -91,9 +251,11 @@ class Event:
 class EncounterEvent(Event):
     """An event where the character encounters someone or something."""
     
+    __slots__ = ("encounter_type", "dialogue", "choices")
+    
     def __init__(self, name, description, encounter_type, location_types=None, 
                  required_flags=None, excluded_flags=None, time_of_day=None,
-                 dialogue=None, choices=None):
+                 dialogue=None, choices=None, shared_mappings=None):
         """
         Initialize an encounter event.
         
@@ -107,11 +269,14 @@ class EncounterEvent(Event):
             time_of_day (list): Times of day when this event can occur
             dialogue (list): Possible dialogue lines for the encounter
             choices (dict): Possible player choices and their consequences
+            shared_mappings (dict): Read-only consequence mappings to share with other events
         """
         super().__init__(name, description, location_types, required_flags, excluded_flags, time_of_day)
         self.encounter_type = encounter_type
         self.dialogue = dialogue or []
-        self.choices = choices or {}
+        shared = {} if shared_mappings is None else shared_mappings
+        self.choices = {choice: _share_mapping(consequence, shared)
+                        for choice, consequence in (choices or {}).items()}
         
     def execute(self, game, character):
         """Execute the encounter event.
@@ -127,11 +292,11 @@ class EncounterEvent(Event):
         if not self.check_flags(character):
             return None
             
-        base_result = f"{self.description}"
-        
         # Add dialogue if available
         if self.dialogue:
-            base_result += f"\n\n\"{random.choice(self.dialogue)}\""
+            base_result = f"{self.description}\n\n\"{_choice(self.dialogue)}\""
+        else:
+            base_result = self.description
         
         # Present choices if available
         if self.choices and len(self.choices) > 0:
@@ -142,24 +307,11 @@ class EncounterEvent(Event):
             for i, choice in enumerate(choice_options, 1):
                 choice_text += f"{i}. {choice}\n"
                 
-            print(f"\n{base_result}")
-            print(choice_text)
+            # One write for the whole prompt
+            print(f"\n{base_result}\n{choice_text}")
             
             # Get player's choice
-            valid_choice = False
-            choice_index = 0
-            
-            while not valid_choice:
-                try:
-                    choice_input = input(f"Enter your choice (1-{len(choice_options)}): ")
-                    choice_index = int(choice_input) - 1
-                    if 0 <= choice_index < len(choice_options):
-                        valid_choice = True
-                    else:
-                        print(f"Please enter a number between 1 and {len(choice_options)}.")
-                except ValueError:
-                    print("Please enter a valid number.")
-                    
+            choice_index = _prompt_index(f"Enter your choice (1-{len(choice_options)}): ", len(choice_options))
             chosen_option = choice_options[choice_index]
             consequence = self.choices[chosen_option]
 
@@ -173,50 +325,42 @@ class EncounterEvent(Event):
             # Apply impacts if defined
             if 'impacts' in consequence:
                 for stat, value in consequence['impacts'].items():
-                    if stat == 'hope' and hasattr(character, 'hope'):
-                        character.hope = max(0, min(100, character.hope + value))
-                    elif stat == 'health' and hasattr(character, 'health'):
-                        character.health = max(0, min(100, character.health + value))
-                    elif stat == 'water' and hasattr(character, 'water'):
-                        character.water = max(0, min(100, character.water + value))
-                    elif stat == 'food' and hasattr(character, 'food'):
-                        character.food = max(0, min(100, character.food + value))
-                    elif stat == 'moral_compass' and hasattr(character, 'moral_compass'):
-                        character.moral_compass = max(0, min(100, character.moral_compass + value))
-                    elif stat == 'stress' and hasattr(character, 'stress'):
-                        character.stress = max(0, min(100, character.stress + value))
+                    if stat in _CLAMPED_STATS and stat in character.STATS:
+                        setattr(character, stat, _clamp100(getattr(character, stat) + value))
                         
             # Set any flags from the consequence
             if 'flags' in consequence:
-                for flag, value in consequence['flags'].items():
-                    character.set_flag(flag, value)
+                character.set_flags(consequence['flags'])
                     
             return result
         
         # Different outcomes based on encounter type if no choices
-        if self.encounter_type == 'patrol' and hasattr(character, 'hope'):
+        if self.encounter_type == 'patrol':
             # Migrants lose hope when encountering patrol
-            character.hope = max(0, character.hope - 20)
-            return f"{base_result}\n{character.name}'s hope diminishes."
+            if 'hope' in character.STATS:
+                character.hope = max(0, character.hope - 20)
+                return f"{base_result}\n{character.name}'s hope diminishes."
             
-        elif self.encounter_type == 'migrant' and hasattr(character, 'stress'):
+        elif self.encounter_type == 'migrant':
             # Border patrol agents gain stress when encountering migrants
-            character.stress = min(100, character.stress + 10)
-            return f"{base_result}\n{character.name}'s stress increases."
+            if 'stress' in character.STATS:
+                character.stress = min(100, character.stress + 10)
+                return f"{base_result}\n{character.name}'s stress increases."
             
-        elif self.encounter_type == 'local' and hasattr(character, 'hope'):
+        elif self.encounter_type == 'local':
             # Migrants gain hope when encountering helpful locals
-            character.hope = min(100, character.hope + 10)
-            return f"{base_result}\n{character.name} feels more hopeful."
+            if 'hope' in character.STATS:
+                character.hope = min(100, character.hope + 10)
+                return f"{base_result}\n{character.name} feels more hopeful."
             
         elif self.encounter_type == 'wildlife':
             # Wildlife encounters can be dangerous
-            if random.random() < 0.3:  # 30% chance of danger
+            if _random() < 0.3:  # 30% chance of danger
                 character.health = max(0, character.health - 10)
                 return f"{base_result}\nThe wildlife encounter costs {character.name} some health."
             else:
                 # Not dangerous, possibly beneficial for Border Patrol morale
-                if hasattr(character, 'moral_compass'):
+                if 'moral_compass' in character.STATS:
                     character.moral_compass = min(100, character.moral_compass + 5)
                     return f"{base_result}\nThe wildlife encounter reminds {character.name} of the beauty in this harsh land."
             
@@ -226,6 +370,8 @@ class EncounterEvent(Event):
 class ResourceEvent(Event):
     """An event related to finding or losing resources."""
     
+    __slots__ = ("resource_type", "amount", "difficulty", "_stat_messages")
+    
     def __init__(self, name, description, resource_type, amount, location_types=None, 
                  required_flags=None, excluded_flags=None, time_of_day=None, difficulty=None):
         """
@@ -246,6 +392,7 @@ class ResourceEvent(Event):
         self.resource_type = resource_type
         self.amount = amount
         self.difficulty = difficulty
+        self._stat_messages = _STAT_RESOURCE_MESSAGES.get(resource_type)
         
     def execute(self, game, character):
         """Execute the resource event.
@@ -267,48 +414,36 @@ class ResourceEvent(Event):
         success = True
         if self.difficulty is not None:
             # Success based on character skills if available
-            if hasattr(character, 'survival_skills'):
-                success_chance = min(90, max(10, character.survival_skills - self.difficulty + 50))
+            survival_skills = character.survival_skills if 'survival_skills' in character.STATS else None
+            success_chance = _resource_success_chance(self.difficulty, survival_skills)
+            success = _random() * 100 < success_chance
+        
+        # Failed to find the resource
+        if not success and self.amount > 0:
+            return f"{base_result}\nDespite efforts, {character.name} failed to acquire the resource."
+        
+        # Water, food and health are clamped stats that share one code path
+        if self._stat_messages is not None:
+            if self.resource_type not in character.STATS:
+                return base_result
+            value = getattr(character, self.resource_type)
+            gained, lost, lost_anyway = self._stat_messages
+            if success:
+                new_value = _clamp100(value + self.amount)
+                message = gained if self.amount > 0 else lost
             else:
-                success_chance = min(90, max(10, 100 - self.difficulty))
-                
-            success = random.randint(1, 100) <= success_chance
+                # Still lose resources on failure to protect
+                new_value = max(0, value + self.amount)
+                message = lost_anyway
+            setattr(character, self.resource_type, new_value)
+            change = new_value - value
+            return f"{base_result}\n" + message.format(name=character.name, change=change, loss=-change)
         
         # Apply resource effects based on success
         if success:
-            if self.resource_type == 'water' and hasattr(character, 'water'):
-                old_water = character.water
-                character.water = max(0, min(100, character.water + self.amount))
-                change = character.water - old_water
-                
-                if self.amount > 0:
-                    return f"{base_result}\n{character.name} found water (+{change} water)."
-                else:
-                    return f"{base_result}\n{character.name} lost water ({change} water)."
-                    
-            elif self.resource_type == 'food' and hasattr(character, 'food'):
-                old_food = character.food
-                character.food = max(0, min(100, character.food + self.amount))
-                change = character.food - old_food
-                
-                if self.amount > 0:
-                    return f"{base_result}\n{character.name} found food (+{change} food)."
-                else:
-                    return f"{base_result}\n{character.name} lost food ({change} food)."
-                    
-            elif self.resource_type == 'health':
-                old_health = character.health
-                character.health = max(0, min(100, character.health + self.amount))
-                change = character.health - old_health
-                
-                if self.amount > 0:
-                    return f"{base_result}\n{character.name}'s health improved (+{change} health)."
-                else:
-                    return f"{base_result}\n{character.name}'s health worsened ({change} health)."
-                    
-            elif self.resource_type == 'money' and hasattr(character, 'money'):
+            if self.resource_type == 'money' and 'money' in character.STATS:
                 old_money = character.money
-                character.money += self.amount
+                character.money = old_money + self.amount
                 change = character.money - old_money
                 
                 if self.amount > 0:
@@ -317,104 +452,121 @@ class ResourceEvent(Event):
                     return f"{base_result}\n{character.name} lost ${-change}."
                     
             elif self.resource_type == 'item':
-                if self.amount > 0 and hasattr(game, 'items') and game.items:
+                items = getattr(game, 'items', None)
+                if self.amount > 0 and items:
                     # Add a random item from game's item pool
-                    item = random.choice(game.items)
+                    item = _choice(items)
                     character.add_to_inventory(item)
                     return f"{base_result}\n{character.name} found {item}."
                 elif self.amount < 0 and character.inventory:
                     # Remove a random item from inventory
-                    item = random.choice(character.inventory)
+                    item = _choice(character.inventory)
                     character.remove_from_inventory(item)
                     return f"{base_result}\n{character.name} lost {item}."
-        else:
-            # Failed to find/protect resource
-            if self.amount > 0:
-                return f"{base_result}\nDespite efforts, {character.name} failed to acquire the resource."
-            else:
-                # Still lose resources on failure to protect
-                if self.resource_type == 'water' and hasattr(character, 'water'):
-                    old_water = character.water
-                    character.water = max(0, character.water + self.amount)
-                    change = character.water - old_water
-                    return f"{base_result}\nDespite efforts to protect supplies, {character.name} lost {-change} water."
-                elif self.resource_type == 'food' and hasattr(character, 'food'):
-                    old_food = character.food
-                    character.food = max(0, character.food + self.amount)
-                    change = character.food - old_food
-                    return f"{base_result}\nDespite efforts to protect supplies, {character.name} lost {-change} food."
-                elif self.resource_type == 'health':
-                    old_health = character.health
-                    character.health = max(0, character.health + self.amount)
-                    change = character.health - old_health
-                    return f"{base_result}\n{character.name} was injured, losing {-change} health."
-                elif self.resource_type == 'item' and character.inventory:
-                    item = random.choice(character.inventory)
-                    character.remove_from_inventory(item)
-                    return f"{base_result}\n{character.name} lost {item} despite attempts to protect it."
+        elif self.resource_type == 'item' and character.inventory:
+            # Failed to protect the item
+            item = _choice(character.inventory)
+            character.remove_from_inventory(item)
+            return f"{base_result}\n{character.name} lost {item} despite attempts to protect it."
         
         return base_result
+
+
+# Ways a migrant can attempt to cross the border wall, with varying risks
+_CROSSING_METHODS = (
+    MappingProxyType({
+        "name": "Climb over with makeshift ladder",
+        "description": "Use a homemade ladder to scale the wall in a less monitored section.",
+        "success_chance": 40,
+        "health_risk": 15,
+        "requires": None,
+        "outcome_success": "You carefully set up the ladder against the wall during a patrol gap. Climbing is harder than expected, especially while carrying your belongings. At the top, you must drop down 20 feet to the other side. The impact jars through your body, but you've made it across.",
+        "outcome_failure": "The ladder shifts unexpectedly as you climb. You fall hard onto Mexican soil, painfully injuring yourself. Border Patrol spotlights sweep nearby, forcing you to retreat quickly."
+    }),
+    MappingProxyType({
+        "name": "Pay a guide (coyote) for tunnel access",
+        "description": "Pay $50 to use a hidden tunnel that runs beneath the border wall.",
+        "success_chance": 70,
+        "health_risk": 10,
+        "requires": MappingProxyType({"money": 50}),
+        "outcome_success": "The guide leads you to an unmarked location half a mile from the wall. You squeeze into a narrow tunnel, crawling through darkness for what feels like hours. Emerging on the US side, you're disoriented but safely across.",
+        "outcome_failure": "The tunnel entrance seems suspicious, and indeed, you spot signs of recent patrol activity. Your guide abandons you when border patrol vehicles approach, keeping your payment while you're forced to retreat."
+    }),
+    MappingProxyType({
+        "name": "Find a gap in the fence",
+        "description": "Search for damaged sections where you might slip through.",
+        "success_chance": 30,
+        "health_risk": 5,
+        "requires": None,
+        "outcome_success": "After hours of careful scouting, you find a section where erosion has created a small gap beneath the wall. It's a tight squeeze that tears your clothing and scrapes your skin, but you wriggle through to the other side.",
+        "outcome_failure": "You find what appears to be a gap, but while attempting to squeeze through, you become temporarily stuck. By the time you extract yourself, you've been spotted by a patrol drone and must flee back into Mexican territory."
+    }),
+    MappingProxyType({
+        "name": "Wait for nightfall and use wire cutters",
+        "description": "Use wire cutters to create an opening in a less monitored section at night.",
+        "success_chance": 50,
+        "health_risk": 10,
+        "requires": MappingProxyType({"item": "Wire Cutters"}),
+        "outcome_success": "Under cover of darkness, you approach a section between camera posts. The sound of metal cutting through metal seems deafening in the night silence. You create just enough space to squeeze through, leaving behind a gap that will likely be discovered by morning patrols.",
+        "outcome_failure": "As you begin cutting, bright floodlights suddenly illuminate your position. The Border Patrol has night vision technology, and your attempt has been discovered. You run back toward Nogales to avoid capture."
+    }),
+    MappingProxyType({
+        "name": "Join a larger group crossing",
+        "description": "Safety in numbers - join 15-20 others attempting a coordinated crossing.",
+        "success_chance": 60,
+        "health_risk": 20,
+        "requires": MappingProxyType({"money": 30}),
+        "outcome_success": "You join a large group led by experienced guides. When you reach the wall, the group splits into smaller units. While Border Patrol intercepts some groups, yours slips through during the chaos. The sprint across open terrain is exhausting, but you make it to the pickup point.",
+        "outcome_failure": "The large group attracts immediate attention. Patrol vehicles, helicopters, and agents converge quickly. In the ensuing chaos, some make it across, but you're forced back into Mexico as agents close in."
+    }),
+)
+
+
+def _crossing_narratives(method):
+    """Return the (success, failure) result templates of a crossing method.
     
+    Args:
+        method (Mapping): Entry of _CROSSING_METHODS
+        
+    Returns:
+        tuple: Templates taking the health change as their only field
+    """
+    intro = f"You attempt to cross using the '{method['name']}' method.\n\n"
+    return (intro + method["outcome_success"] + "\n\nThe crossing takes a physical toll ({} health).",
+            intro + method["outcome_failure"] + "\n\nThe failed attempt is costly to your health ({} health).")
+
+
+# Result templates of each crossing method, in the same order
+_CROSSING_NARRATIVES = tuple(_crossing_narratives(method) for method in _CROSSING_METHODS)
+
+# Numbered menu line of each crossing method, before its requirement text
+_CROSSING_LABELS = tuple(f"{i}. {method['name']}: {method['description']}"
+                         for i, method in enumerate(_CROSSING_METHODS, 1))
+
+
 class BorderCrossingEvent(Event):
     """An event specifically for crossing the border wall."""
     
+    __slots__ = ("crossing_methods", "_narratives", "_labels", "_money_costs", "_required_items_by_method")
+    
+    # Border crossings only happen at Border locations
+    _BORDER_TYPES = (Border,)
+    
     def __init__(self, name, description, location_types=None, 
                  required_flags=None, excluded_flags=None, time_of_day=None):
         """Initialize a border crossing event."""
-        # Make sure this only happens at Border locations
-        from location import Border
-        super().__init__(name, description, location_types=[Border], 
+        super().__init__(name, description, location_types=self._BORDER_TYPES, 
                         required_flags=required_flags, excluded_flags=excluded_flags, 
                         time_of_day=time_of_day)
         
-        # Define different crossing methods with varying risks
-        self.crossing_methods = [
-            {
-                "name": "Climb over with makeshift ladder",
-                "description": "Use a homemade ladder to scale the wall in a less monitored section.",
-                "success_chance": 40,
-                "health_risk": 15,
-                "requires": None,
-                "outcome_success": "You carefully set up the ladder against the wall during a patrol gap. Climbing is harder than expected, especially while carrying your belongings. At the top, you must drop down 20 feet to the other side. The impact jars through your body, but you've made it across.",
-                "outcome_failure": "The ladder shifts unexpectedly as you climb. You fall hard onto Mexican soil, painfully injuring yourself. Border Patrol spotlights sweep nearby, forcing you to retreat quickly."
-            },
-            {
-                "name": "Pay a guide (coyote) for tunnel access",
-                "description": "Pay $50 to use a hidden tunnel that runs beneath the border wall.",
-                "success_chance": 70,
-                "health_risk": 10,
-                "requires": {"money": 50},
-                "outcome_success": "The guide leads you to an unmarked location half a mile from the wall. You squeeze into a narrow tunnel, crawling through darkness for what feels like hours. Emerging on the US side, you're disoriented but safely across.",
-                "outcome_failure": "The tunnel entrance seems suspicious, and indeed, you spot signs of recent patrol activity. Your guide abandons you when border patrol vehicles approach, keeping your payment while you're forced to retreat."
-            },
-            {
-                "name": "Find a gap in the fence",
-                "description": "Search for damaged sections where you might slip through.",
-                "success_chance": 30,
-                "health_risk": 5,
-                "requires": None,
-                "outcome_success": "After hours of careful scouting, you find a section where erosion has created a small gap beneath the wall. It's a tight squeeze that tears your clothing and scrapes your skin, but you wriggle through to the other side.",
-                "outcome_failure": "You find what appears to be a gap, but while attempting to squeeze through, you become temporarily stuck. By the time you extract yourself, you've been spotted by a patrol drone and must flee back into Mexican territory."
-            },
-            {
-                "name": "Wait for nightfall and use wire cutters",
-                "description": "Use wire cutters to create an opening in a less monitored section at night.",
-                "success_chance": 50,
-                "health_risk": 10,
-                "requires": {"item": "Wire Cutters"},
-                "outcome_success": "Under cover of darkness, you approach a section between camera posts. The sound of metal cutting through metal seems deafening in the night silence. You create just enough space to squeeze through, leaving behind a gap that will likely be discovered by morning patrols.",
-                "outcome_failure": "As you begin cutting, bright floodlights suddenly illuminate your position. The Border Patrol has night vision technology, and your attempt has been discovered. You run back toward Nogales to avoid capture."
-            },
-            {
-                "name": "Join a larger group crossing",
-                "description": "Safety in numbers - join 15-20 others attempting a coordinated crossing.",
-                "success_chance": 60,
-                "health_risk": 20,
-                "requires": {"money": 30},
-                "outcome_success": "You join a large group led by experienced guides. When you reach the wall, the group splits into smaller units. While Border Patrol intercepts some groups, yours slips through during the chaos. The sprint across open terrain is exhausting, but you make it to the pickup point.",
-                "outcome_failure": "The large group attracts immediate attention. Patrol vehicles, helicopters, and agents converge quickly. In the ensuing chaos, some make it across, but you're forced back into Mexico as agents close in."
-            }
-        ]
+        # Crossing methods never change, so every instance shares the same read-only tuple
+        self.crossing_methods = _CROSSING_METHODS
+        self._narratives = _CROSSING_NARRATIVES
+        self._labels = _CROSSING_LABELS
+        # Money cost and required item of each method, or None
+        self._money_costs = tuple((method["requires"] or {}).get("money") for method in self.crossing_methods)
+        self._required_items_by_method = tuple((method["requires"] or {}).get("item")
+                                               for method in self.crossing_methods)
     
     def execute(self, game, character):
         """Execute the border crossing event for the given character.
@@ -435,69 +587,53 @@ class BorderCrossingEvent(Event):
         if not self.check_flags(character):
             return None
             
-        # Present the crossing options
-        print(f"\n-----BORDER CROSSING CHALLENGE-----")
-        print(self.description)
-        print("\nYou must find a way past the heavily guarded border wall. Each method has risks and requirements.")
+        # Present the crossing options, collected so the prompt is written at once
+        lines = ["\n-----BORDER CROSSING CHALLENGE-----", self.description,
+                 "\nYou must find a way past the heavily guarded border wall. Each method has risks and requirements."]
         
-        # Show available options
-        valid_options = []
-        for i, method in enumerate(self.crossing_methods, 1):
+        # Show available options, marking usable ones with bit i of valid_mask
+        money = character.money if 'money' in character.STATS else None
+        valid_mask = 0
+        for i, (label, cost, item) in enumerate(zip(self._labels, self._money_costs,
+                                                    self._required_items_by_method)):
             # Check if player meets requirements
             can_use = True
             req_text = ""
             
-            if method["requires"]:
-                if "money" in method["requires"] and hasattr(character, 'money'):
-                    if character.money < method["requires"]["money"]:
-                        can_use = False
-                        req_text = f" (Requires ${method['requires']['money']} - you only have ${character.money})"
-                    else:
-                        req_text = f" (Costs ${method['requires']['money']})"
-                        
-                if "item" in method["requires"] and method["requires"]["item"] not in character.inventory:
+            if cost is not None and money is not None:
+                if money < cost:
                     can_use = False
-                    req_text = f" (Requires {method['requires']['item']} - not in your inventory)"
+                    req_text = f" (Requires ${cost} - you only have ${money})"
+                else:
+                    req_text = f" (Costs ${cost})"
+                    
+            if item is not None and item not in character.inventory:
+                can_use = False
+                req_text = f" (Requires {item} - not in your inventory)"
             
-            if can_use:
-                valid_options.append(i-1)  # Store index of valid option
-                
             # Format text differently based on availability
             if can_use:
-                print(f"{i}. {method['name']}: {method['description']}{req_text}")
+                valid_mask |= 1 << i
+                lines.append(label + req_text)
             else:
-                print(f"{i}. {method['name']}: {method['description']}{req_text} [NOT AVAILABLE]")
+                lines.append(f"{label}{req_text} [NOT AVAILABLE]")
+        print("\n".join(lines))
         
-        if not valid_options:
+        if not valid_mask:
             return "You don't have the resources needed for any crossing method. You'll need to gather more supplies or money."
             
         # Get player's choice
-        valid_choice = False
-        choice_index = 0
+        count = len(self.crossing_methods)
+        choice_index = _prompt_index(f"\nChoose your crossing method (1-{count}): ", count, valid_mask)
         
-        while not valid_choice:
-            try:
-                choice_input = input(f"\nChoose your crossing method (1-{len(self.crossing_methods)}): ")
-                choice_index = int(choice_input) - 1
-                if 0 <= choice_index < len(self.crossing_methods):
-                    if choice_index in valid_options:
-                        valid_choice = True
-                    else:
-                        print("You don't meet the requirements for that method. Choose another.")
-                else:
-                    print(f"Please enter a number between 1 and {len(self.crossing_methods)}.")
-            except ValueError:
-                print("Please enter a valid number.")
-                
         chosen_method = self.crossing_methods[choice_index]
         
         # Apply resource costs
-        if chosen_method["requires"] and "money" in chosen_method["requires"]:
-            character.money -= chosen_method["requires"]["money"]
+        if self._money_costs[choice_index] is not None:
+            character.money -= self._money_costs[choice_index]
         
         # Determine success based on chance
-        success_roll = random.randint(1, 100)
-        success = success_roll <= chosen_method["success_chance"]
+        success = _random() * 100 < chosen_method["success_chance"]
         
         # Apply health impact
         health_impact = chosen_method["health_risk"]
@@ -508,13 +644,12 @@ class BorderCrossingEvent(Event):
         character.health = max(0, character.health - health_impact)
         health_change = character.health - old_health
         
-        # Build result narrative
-        result = f"You attempt to cross using the '{chosen_method['name']}' method.\n\n"
+        # Build result narrative from the method's prebuilt templates, joined once at the end
+        success_text, failure_text = self._narratives[choice_index]
         
         # Handle success or failure
         if success:
-            result += chosen_method["outcome_success"]
-            result += f"\n\nThe crossing takes a physical toll ({health_change} health)."
+            parts = [success_text.format(health_change)]
             
             # Move character to US side if currently at border
             if game.current_location.name == "Border Wall":
@@ -529,37 +664,39 @@ class BorderCrossingEvent(Event):
                 game.story.update_journey_stats("key_events", f"Successfully crossed border using {chosen_method['name']}")
                 
                 # Add some hope for successful crossing
-                if hasattr(character, 'hope'):
+                if 'hope' in character.STATS:
                     character.hope = min(100, character.hope + 15)
-                    result += " Despite the difficulties, your spirits rise as you set foot on US soil."
+                    parts.append(" Despite the difficulties, your spirits rise as you set foot on US soil.")
             
         else:
-            result += chosen_method["outcome_failure"]
-            result += f"\n\nThe failed attempt is costly to your health ({health_change} health)."
+            parts = [failure_text.format(health_change)]
             
             # Reduce hope for failed crossing
-            if hasattr(character, 'hope'):
+            if 'hope' in character.STATS:
                 character.hope = max(0, character.hope - 10)
-                result += " Your failed attempt weighs heavily on your spirit."
+                parts.append(" Your failed attempt weighs heavily on your spirit.")
                 
             # Update journey stats
             game.story.update_journey_stats("key_events", f"Failed border crossing attempt using {chosen_method['name']}")
         
         # Add trauma from the experience
-        if hasattr(character, 'trauma'):
+        if 'trauma' in character.STATS:
             trauma_increase = 5 if success else 10
             character.trauma = min(100, character.trauma + trauma_increase)
             
         # Apply the turn count
         game.turn_count += 1
             
-        return result
+        return "".join(parts)
 
 class MoralEvent(Event):
     """An event that presents a moral choice to the character."""
     
+    __slots__ = ("choices", "consequences", "event_type", "_consequence_flags")
+    
     def __init__(self, name, description, choices, consequences, location_types=None, 
-                 required_flags=None, excluded_flags=None, time_of_day=None, event_type="moral"):
+                 required_flags=None, excluded_flags=None, time_of_day=None, event_type="moral",
+                 shared_mappings=None):
         """
         Initialize a moral event.
         
@@ -573,10 +710,15 @@ class MoralEvent(Event):
             excluded_flags (dict): Flags that prevent this event from occurring
             time_of_day (list): Times of day when this event can occur
             event_type (str): Type of moral event ("moral", "survival", "loyalty")
+            shared_mappings (dict): Read-only consequence mappings to share with other events
         """
         super().__init__(name, description, location_types, required_flags, excluded_flags, time_of_day)
         self.choices = choices
-        self.consequences = consequences
+        shared = {} if shared_mappings is None else shared_mappings
+        self.consequences = [_share_mapping(consequence, shared) for consequence in consequences]
+        # (flag, value) pairs each consequence sets, kept beside the read-only consequences
+        self._consequence_flags = tuple(tuple(consequence.get('flags', {}).items())
+                                        for consequence in self.consequences)
         self.event_type = event_type
         
     def execute(self, game, character):
@@ -593,68 +735,33 @@ class MoralEvent(Event):
         if not self.check_flags(character):
             return None
         
-        # Print the event description FIRST
-        print(f"\n{self.description}")
-
-        # Present choices to the player
-        choice_text = "\nChoices:\n"
-        for i, choice in enumerate(self.choices):
-            choice_text += f"{i+1}. {choice}\n"
-        print(choice_text)
+        # Print the event description FIRST, then the choices, in one write
+        choice_text = "".join(f"{i+1}. {choice}\n" for i, choice in enumerate(self.choices))
+        print(f"\n{self.description}\n\nChoices:\n{choice_text}")
 
         # Get player input for the choice
-        while True:
-            try:
-                choice_input = input(f"Enter choice (1-{len(self.choices)}): ")
-                choice_index = int(choice_input) - 1
-                if 0 <= choice_index < len(self.choices):
-                    break
-                else:
-                    print("Invalid choice. Please enter a number from the list.")
-            except ValueError:
-                print("Invalid input. Please enter a number.")
-                
+        choice_index = _prompt_index(f"Enter choice (1-{len(self.choices)}): ", len(self.choices),
+                                     range_message="Invalid choice. Please enter a number from the list.",
+                                     number_message="Invalid input. Please enter a number.")
+        
         consequence = self.consequences[choice_index]
+        stats = character.STATS
+        changes = []
         
         # Apply the consequences based on character type and event type
-        if hasattr(character, 'moral_compass'):
-            # Border patrol moral compass adjustment
-            moral_impact = consequence.get('moral_impact', 0)
-            old_moral = character.moral_compass
-            character.moral_compass = max(0, min(100, character.moral_compass + moral_impact))
-            moral_change = character.moral_compass - old_moral
-            
-            # Also affects stress
-            if hasattr(character, 'stress'):
-                stress_impact = consequence.get('stress_impact', 0)
-                old_stress = character.stress
-                character.stress = max(0, min(100, character.stress + stress_impact))
-                stress_change = character.stress - old_stress
-                
-        if hasattr(character, 'hope'):
-            # Migrant hope adjustment
-            hope_impact = consequence.get('hope_impact', 0)
-            old_hope = character.hope
-            character.hope = max(0, min(100, character.hope + hope_impact))
-            hope_change = character.hope - old_hope
-            
-            # Traumatic moral choices also affect trauma
-            if self.event_type in ["survival", "loyalty"] and hasattr(character, 'trauma'):
-                trauma_impact = consequence.get('trauma_impact', max(0, -hope_impact // 2))
-                old_trauma = character.trauma
-                character.trauma = max(0, min(100, character.trauma + trauma_impact))
-                trauma_change = character.trauma - old_trauma
-                
-        # Health impacts if specified
-        if 'health_impact' in consequence and hasattr(character, 'health'):
-            health_impact = consequence.get('health_impact', 0)
-            old_health = character.health
-            character.health = max(0, min(100, character.health + health_impact))
-            health_change = character.health - old_health
+        for key, stat, name in _MORAL_IMPACTS:
+            delta = consequence.get(key)
+            if stat == 'trauma':
+                # Only traumatic moral choices affect trauma, by default half the hope lost
+                if self.event_type not in ("survival", "loyalty"):
+                    continue
+                if delta is None:
+                    delta = max(0, -consequence.get('hope_impact', 0) // 2)
+            if delta and stat in stats:
+                changes.append((name, _apply_stat(character, stat, delta)))
             
         # Set any story flags from the consequence
-        for flag, value in consequence.get('flags', {}).items():
-            character.set_flag(flag, value)
+        character.set_flags(self._consequence_flags[choice_index])
             
         # Track moral choice in game stats if available
         if hasattr(game, 'story') and hasattr(game.story, 'update_journey_stats'):
@@ -665,15 +772,7 @@ class MoralEvent(Event):
             
         # Build result description with stat changes if significant
         result_description = consequence.get('description', '')
-        stat_changes = []
-        
-        locals_dict = locals()
-        for stat in ['hope_change', 'moral_change', 'stress_change', 'trauma_change', 'health_change']:
-            if stat in locals_dict and locals_dict[stat] != 0:
-                change = locals_dict[stat]
-                stat_name = stat.split('_')[0]
-                symbol = "+" if change > 0 else ""
-                stat_changes.append(f"{stat_name}: {symbol}{change}")
+        stat_changes = [f"{stat_name}: {change:+}" for stat_name, change in changes if change]
                 
         if stat_changes:
             result_description += f"\n[{', '.join(stat_changes)}]"
@@ -684,6 +783,8 @@ class MoralEvent(Event):
 class WeatherEvent(Event):
     """An event that changes the weather conditions."""
     
+    __slots__ = ("weather_type", "effects", "duration", "_immediate_effects", "_environment_effects")
+    
     def __init__(self, name, description, weather_type, effects, location_types=None, 
                  required_flags=None, excluded_flags=None, time_of_day=None, duration=3):
         """Initialize a weather event.
@@ -703,6 +804,13 @@ class WeatherEvent(Event):
         self.weather_type = weather_type
         self.effects = effects
         self.duration = duration
+        # Only the effects this weather actually defines, resolved once
+        self._immediate_effects = tuple((stat, label, effects[key])
+                                        for key, stat, label in _WEATHER_IMMEDIATE_EFFECTS
+                                        if key in effects)
+        self._environment_effects = tuple((key, effects[key])
+                                          for key in _WEATHER_ENVIRONMENT_KEYS
+                                          if key in effects)
         
     def execute(self, game, character):
         """Execute the weather event.
@@ -728,41 +836,58 @@ class WeatherEvent(Event):
             }
             
         # Apply immediate effects if any
-        impact_text = ""
-        
-        if 'immediate_water' in self.effects and hasattr(character, 'water'):
-            water_change = self.effects['immediate_water']
-            old_water = character.water
-            character.water = max(0, min(100, character.water + water_change))
-            water_diff = character.water - old_water
-            
-            if water_diff != 0:
-                impact_text += f"\nWater: {'+' if water_diff > 0 else ''}{water_diff}"
-                
-        if 'immediate_health' in self.effects and hasattr(character, 'health'):
-            health_change = self.effects['immediate_health']
-            old_health = character.health
-            character.health = max(0, min(100, character.health + health_change))
-            health_diff = character.health - old_health
-            
-            if health_diff != 0:
-                impact_text += f"\nHealth: {'+' if health_diff > 0 else ''}{health_diff}"
+        impact_lines = []
+        for stat, label, amount in self._immediate_effects:
+            if stat in character.STATS:
+                change = _apply_stat(character, stat, amount)
+                if change != 0:
+                    impact_lines.append(_format_change(label, change))
+        impact_text = "".join(impact_lines)
                 
         # Apply environment changes to location if possible
-        if game.current_location and hasattr(game.current_location, 'set_environment'):
-            if 'visibility' in self.effects:
-                game.current_location.set_environment('visibility', self.effects['visibility'])
-            if 'terrain' in self.effects:
-                game.current_location.set_environment('terrain', self.effects['terrain'])
-            if 'temperature' in self.effects:
-                game.current_location.set_environment('temperature', self.effects['temperature'])
+        if (self._environment_effects and game.current_location
+                and hasattr(game.current_location, 'set_environment')):
+            for key, value in self._environment_effects:
+                game.current_location.set_environment(key, value)
                 
         return f"{self.description}{impact_text}"
 
 
+def _trauma_severity(trauma_level, hope=None, moral_compass=None):
+    """Return the trauma level a character actually suffers.
+    
+    Characters with high hope or moral compass resist trauma better.
+    
+    Args:
+        trauma_level (int): Severity of the trauma event (1-10)
+        hope (int): Character's hope, or None if they have none
+        moral_compass (int): Character's moral compass, or None if they have none
+        
+    Returns:
+        int: Reduced trauma level, at least 1
+    """
+    if hope is not None and hope > 70:
+        trauma_level = max(1, trauma_level - 2)
+    if moral_compass is not None and moral_compass > 70:
+        trauma_level = max(1, trauma_level - 1)
+    return trauma_level
+
+
+# Closing reflections offered after a trauma event
+_TRAUMA_REFLECTIONS = (
+    "Some memories can never be fully processed.",
+    "The border changes all who cross it, in ways both visible and invisible.",
+    "Trauma accumulates like layers of sediment, eventually hardening into something unrecognizable.",
+    "What the eyes see, the heart carries forever.",
+    "To witness suffering is to bear a fragment of it within yourself."
+)
+
+
 class TraumaEvent(Event):
     """An event that causes psychological trauma to the character."""
     
+    __slots__ = ("trauma_level", "impact", "_experienced_flag")
+    
     def __init__(self, name, description, trauma_level, location_types=None, 
                  required_flags=None, excluded_flags=None, impact=None):
         """
@@ -780,6 +905,8 @@ class TraumaEvent(Event):
         super().__init__(name, description, location_types, required_flags, excluded_flags)
         self.trauma_level = trauma_level
         self.impact = impact or {}
+        # Story flag set once the character has lived through this event
+        self._experienced_flag = sys.intern(f"experienced_{name.lower().replace(' ', '_')}")
         
     def execute(self, game, character):
         """Execute the trauma event.
@@ -796,82 +923,67 @@ class TraumaEvent(Event):
             return None
             
         # Calculate final trauma based on character's current state
-        final_trauma = self.trauma_level
-        
-        # Characters with high hope/moral compass resist trauma better
-        if hasattr(character, 'hope') and character.hope > 70:
-            final_trauma = max(1, final_trauma - 2)
-        if hasattr(character, 'moral_compass') and character.moral_compass > 70:
-            final_trauma = max(1, final_trauma - 1)
+        stats = character.STATS
+        final_trauma = _trauma_severity(self.trauma_level,
+                                        character.hope if 'hope' in stats else None,
+                                        character.moral_compass if 'moral_compass' in stats else None)
             
         # Apply trauma effects
-        impact_text = ""
+        impact_lines = []
         
         # Primary impact on trauma stat if it exists
-        if hasattr(character, 'trauma'):
-            old_trauma = character.trauma
-            trauma_increase = final_trauma * 5  # Scale 1-10 to 5-50
-            character.trauma = min(100, character.trauma + trauma_increase)
-            trauma_diff = character.trauma - old_trauma
-            
-            impact_text += f"\nTrauma: +{trauma_diff}"
+        if 'trauma' in stats:
+            trauma_diff = _apply_stat(character, 'trauma', final_trauma * 5)  # Scale 1-10 to 5-50
+            impact_lines.append(f"\nTrauma: +{trauma_diff}")
             
         # Secondary impact on hope
-        if hasattr(character, 'hope'):
-            old_hope = character.hope
-            hope_loss = final_trauma * 3  # Scale to 3-30
-            character.hope = max(0, character.hope - hope_loss)
-            hope_diff = character.hope - old_hope
-            
-            impact_text += f"\nHope: {hope_diff}"
+        if 'hope' in stats:
+            hope_diff = _apply_stat(character, 'hope', -final_trauma * 3)  # Scale to 3-30
+            impact_lines.append(f"\nHope: {hope_diff}")
             
         # Apply any custom impacts
         for stat, value in self.impact.items():
-            if stat == 'health' and hasattr(character, 'health'):
-                old_health = character.health
-                character.health = max(0, min(100, character.health + value))
-                health_diff = character.health - old_health
-                
-                if health_diff != 0:
-                    impact_text += f"\nHealth: {'+' if health_diff > 0 else ''}{health_diff}"
-                    
-            elif stat == 'stress' and hasattr(character, 'stress'):
-                old_stress = character.stress
-                character.stress = max(0, min(100, character.stress + value))
-                stress_diff = character.stress - old_stress
-                
-                if stress_diff != 0:
-                    impact_text += f"\nStress: {'+' if stress_diff > 0 else ''}{stress_diff}"
+            label = _TRAUMA_IMPACT_LABELS.get(stat)
+            if label and stat in stats:
+                change = _apply_stat(character, stat, value)
+                if change != 0:
+                    impact_lines.append(_format_change(label, change))
+        impact_text = "".join(impact_lines)
         
         # Set trauma flag for story tracking
-        character.set_flag(f"experienced_{self.name.lower().replace(' ', '_')}", True)
+        character.set_flag(self._experienced_flag, True)
         
         # Track in game stats if available
         if hasattr(game, 'story') and hasattr(game.story, 'update_journey_stats'):
             game.story.update_journey_stats("trauma_experienced")
             
         # Provide a reflection on the trauma
-        reflections = [
-            "Some memories can never be fully processed.",
-            "The border changes all who cross it, in ways both visible and invisible.",
-            "Trauma accumulates like layers of sediment, eventually hardening into something unrecognizable.",
-            "What the eyes see, the heart carries forever.",
-            "To witness suffering is to bear a fragment of it within yourself."
-        ]
-        
-        return f"{self.description}{impact_text}\n\n{random.choice(reflections)}"
+        return f"{self.description}{impact_text}\n\n{_choice(_TRAUMA_REFLECTIONS)}"
 
 
 # Define a comprehensive set of events for use in the game
 def create_common_events():
     """Create a list of common events with rich narrative content.
     
+    Events are read-only templates, so they are built once and shared by
+    every game; each call returns a new list of the same events.
+    
     Returns:
         list: List of Event objects
     """
-    from location import Desert, Border, Settlement  # Import here to avoid circular dependency
+    return list(_build_common_events())
 
+
+@lru_cache(maxsize=1)
+def _build_common_events():
+    """Build the common events.
+    
+    Returns:
+        tuple: Event objects, in the order they are offered to locations
+    """
     events = []
+    # Identical consequence mappings are shared between the events of this build only
+    shared = {}
     
     # ===== ENCOUNTER EVENTS =====
     
@@ -902,7 +1014,8 @@ def create_common_events():
                 "impacts": {"hope": 10, "water": -15, "food": -15},
                 "flags": {"traveling_with_others": True}
             }
-        }
+        },
+        shared_mappings=shared
     )
     events.append(migrant_family_encounter)
     
@@ -932,7 +1045,8 @@ def create_common_events():
                 "impacts": {"health": -5, "hope": 5},
                 "flags": {"carried_belongings": True}
             }
-        }
+        },
+        shared_mappings=shared
     )
     events.append(injured_migrant_encounter)
     
@@ -963,7 +1077,8 @@ def create_common_events():
                 "impacts": {"hope": -20},
                 "flags": {"surrendered_to_patrol": True}
             }
-        }
+        },
+        shared_mappings=shared
     )
     events.append(border_patrol_vehicle)
     
@@ -993,7 +1108,8 @@ def create_common_events():
                 "impacts": {"hope": -10},
                 "flags": {"attempted_bribe": True}
             }
-        }
+        },
+        shared_mappings=shared
     )
     events.append(patrol_on_foot)
     
@@ -1024,7 +1140,8 @@ def create_common_events():
                 "impacts": {"hope": 5},
                 "flags": {"minimized_contact": True}
             }
-        }
+        },
+        shared_mappings=shared
     )
     events.append(sympathetic_local)
     
@@ -1054,7 +1171,8 @@ def create_common_events():
                 "impacts": {"hope": -15, "health": -10},
                 "flags": {"stood_ground": True}
             }
-        }
+        },
+        shared_mappings=shared
     )
     events.append(hostile_locals)
     
@@ -1081,7 +1199,8 @@ def create_common_events():
                 "impacts": {"water": -15, "food": -10},
                 "flags": {"took_detour": True}
             }
-        }
+        },
+        shared_mappings=shared
     )
     events.append(snake_encounter)
     
@@ -1107,7 +1226,8 @@ def create_common_events():
                 "impacts": {"hope": -5},
                 "flags": {"scared_wildlife": True}
             }
-        }
+        },
+        shared_mappings=shared
     )
     events.append(coyote_pack)
     
@@ -1192,7 +1312,8 @@ def create_common_events():
              "hope_impact": 15, "moral_impact": 10, "water_impact": -15, "food_impact": -15, "flags": {"reunited_family": True}}
         ],
         location_types=[Border, Desert],
-        event_type="moral"
+        event_type="moral",
+        shared_mappings=shared
     )
     events.append(abandoned_child)
     
@@ -1214,7 +1335,8 @@ def create_common_events():
              "hope_impact": -20, "moral_impact": -5, "flags": {"left_dying_behind": True}, "trauma_impact": 15}
         ],
         location_types=[Desert],
-        event_type="survival"
+        event_type="survival",
+        shared_mappings=shared
     )
     events.append(dying_migrant)
     
@@ -1236,7 +1358,8 @@ def create_common_events():
         ],
         location_types=[Border],
         required_flags={"is_border_patrol": True},
-        event_type="loyalty"
+        event_type="loyalty",
+        shared_mappings=shared
     )
     events.append(border_patrol_dilemma)
     
@@ -1323,4 +1446,4 @@ def create_common_events():
     )
     events.append(desert_hallucination)
     
-    return events
\ No newline at end of file
+    return tuple(events)
\ No newline at end of file
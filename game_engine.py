@@ -6,13 +6,179 @@ and gameplay flow for the narrative experience.
 """
 
 import random
+import re
 import time
 import sys
+from functools import lru_cache
+from itertools import chain
 from unittest import result
 from character import Character, Migrant, BorderPatrol
 from location import Location, Desert, Border, Settlement
 from events import Event, create_common_events
 from embeddings import EmbeddingsEngine
+from config import RESOURCE_CONSUMPTION
+
+# Typed directions and their single-letter shortcuts
+_DIRECTIONS = {
+    "north": "north", "south": "south", "east": "east", "west": "west",
+    "n": "north", "s": "south", "e": "east", "w": "west"
+}
+
+# Verbs followed by a target, and the interaction each one performs
+_MOVE_VERBS = frozenset({"move", "go"})
+_TARGET_VERBS = {"talk": "talk", "speak": "talk", "take": "take", "get": "take", "use": "use"}
+
+# Commands that take no target, and the interaction each one performs
+_SIMPLE_COMMANDS = {
+    "look": "look", "examine": "look",
+    "status": "status", "inventory": "status",
+    "help": "help"
+}
+_QUIT_COMMANDS = frozenset({"quit", "exit"})
+
+# Services a settlement can offer through "use service [type]"
+_SERVICES = ("food", "shelter", "medical")
+
+# Input the fallback parser understands exactly, so it skips embedding-based matching;
+# anything else, such as "go towards the border", is still matched semantically
+_EXACT_COMMANDS = (frozenset(_DIRECTIONS) | frozenset(_SIMPLE_COMMANDS) | _QUIT_COMMANDS
+                   | frozenset(f"{verb} {direction}" for verb in _MOVE_VERBS for direction in _DIRECTIONS)
+                   | frozenset(f"use service {service}" for service in _SERVICES))
+
+# Command words removed from talk/take/use input to leave the target's name; whole
+# words only, so names like "Tomas" keep their letters
+_TALK_WORDS = re.compile(r"\b(?:talk|to|with)\b")
+_TAKE_WORDS = re.compile(r"\b(?:take|get|pick up)\b")
+_USE_WORDS = re.compile(r"\buse\b")
+
+# Stats shown by get_status after health: (stat, label, bar style); bar style is
+# None for no bar, False for a normal bar and True for a bar where high is bad
+_STATUS_STATS = (
+    ("water", "Water", False),
+    ("food", "Food", False),
+    ("money", "Money", None),
+    ("hope", "Hope", False),
+    ("moral_compass", "Moral Compass", False),
+    ("stress", "Stress", True),
+)
+
+
+def _find_item(items, target):
+    """Return the first item whose name starts or ends with target, ignoring case.
+    
+    Args:
+        items (list): Item names to search
+        target (str): Name typed by the player
+        
+    Returns:
+        str or None: Matching item name, or None if nothing matches
+    """
+    target_lower = target.lower()
+    for item in items:
+        item_lower = item.lower()
+        if item_lower.startswith(target_lower) or item_lower.endswith(target_lower):
+            return item
+    return None
+
+
+def _has_several(items, keyword):
+    """Return True if at least two item names contain keyword, ignoring case.
+    
+    Stops scanning at the second match.
+    """
+    matches = (item for item in items if keyword in item.lower())
+    return next(matches, None) is not None and next(matches, None) is not None
+
+
+# Command reference shown by 'help'
+_HELP_TEXT = (
+    "\nAvailable commands: \n"
+    "- look: Examine your surroundings\n"
+    "- status: Check your current status and inventory\n"
+    "- talk [character]: Talk to a character\n"
+    "- take [item]: Take an item\n"
+    "- use [item]: Use an item from your inventory\n"
+    "- use service [type]: Access settlement services (food/shelter/medical)\n"
+    "- move [direction]: Move in a direction (north, south, east, west)\n"
+    "- help: Show this help text\n"
+    "- quit: Exit the game\n"
+)
+
+# Help text with examples of natural language, shown when AI command matching is available
+_AI_HELP_TEXT = _HELP_TEXT + (
+    "\nThis game features AI-powered natural language understanding.\n"
+    "You can use more natural phrases like:\n"
+    "- 'check my health' instead of 'status'\n"
+    "- 'speak with Manuel' instead of 'talk Manuel'\n"
+    "- 'grab the water' instead of 'take water bottle'\n"
+    "- 'drink from my bottle' instead of 'use water bottle'\n"
+    "- 'head north' instead of 'move north'\n"
+)
+
+# What an agent may hear on the radio when it has useful information
+_PATROL_RADIO_INTEL = (
+    "Radio reports suspicious activity near the border fence.",
+    "Dispatch mentions a group of migrants spotted heading north through the desert.",
+    "Another agent reports finding abandoned supplies near your position.",
+    "You hear chatter about cartel activity increasing in the region.",
+    "A helicopter patrol reports movement along the eastern ridge."
+)
+
+# What a migrant may pick up on the radio
+_MIGRANT_RADIO_INFO = (
+    "You pick up border patrol frequencies. They seem to be focused on the western sector today.",
+    "The radio catches a weather report - extreme heat warnings for the next few days.",
+    "You hear scattered voices discussing patrol schedules. This information could be valuable.",
+    "Static fills the frequencies. It's hard to make out anything useful."
+)
+
+# Stats recorded before an item is used, so handlers can report how much they changed
+_USE_TRACKED_STATS = ("water", "food", "health", "hope")
+
+# Keywords that select how an item is used, checked in order against the item's name
+_USE_KEYWORDS = ("water bottle", "canned food", "first aid kit", "map", "flashlight", "compass",
+                 "family photo", "blanket", "money", "id papers", "radio")
+
+
+@lru_cache(maxsize=256)
+def _use_keyword(item_lower):
+    """Return the first use keyword contained in a lowercased item name, or None."""
+    for keyword in _USE_KEYWORDS:
+        if keyword in item_lower:
+            return keyword
+    return None
+
+
+@lru_cache(maxsize=512)
+def _visual_bar(value, length, invert):
+    """Build a stat bar for GameEngine.get_visual_bar.
+    
+    Stats only take values 0-100, so each distinct bar is built once and cached.
+    """
+    filled_char = "█"
+    empty_char = "░"
+    
+    # Calculate filled portion
+    value = max(0, min(100, value))  # Ensure value is in 0-100 range
+    filled_length = int(value / 100 * length)
+    empty_length = length - filled_length
+    
+    if invert:
+        # For inverted stats (like stress), high is bad
+        if value >= 80:
+            return f"[!] {filled_char * filled_length}{empty_char * empty_length} [CRITICAL]"
+        elif value >= 60:
+            return f"[!] {filled_char * filled_length}{empty_char * empty_length} [HIGH]"
+        else:
+            return f"{filled_char * filled_length}{empty_char * empty_length}"
+    else:
+        # For normal stats, low is bad
+        if value <= 20:
+            return f"[!] {filled_char * filled_length}{empty_char * empty_length} [CRITICAL]"
+        elif value <= 40:
+            return f"[!] {filled_char * filled_length}{empty_char * empty_length} [LOW]"
+        else:
+            return f"{filled_char * filled_length}{empty_char * empty_length}"
 
 
 class GameEngine:
@@ -248,9 +414,8 @@ class GameEngine:
             self.embeddings_engine.initialize_location_embeddings(self.world)
             
             # Initialize character embeddings
-            all_characters = []
-            for location in self.world.values():
-                all_characters.extend(location.characters)
+            all_characters = list(chain.from_iterable(location.characters
+                                                      for location in self.world.values()))
             if self.player:
                 all_characters.append(self.player)
             self.embeddings_engine.initialize_character_embeddings(all_characters)
@@ -282,7 +447,11 @@ class GameEngine:
         self.story.display_intro(self.current_location.name, character_type)
         
         # Main game loop
-        self.main_loop()
+        try:
+            self.main_loop()
+        finally:
+            if self.embeddings_engine:
+                self.embeddings_engine.close()
         
         # Display journey summary and ending
         if self.game_over:
@@ -326,11 +495,12 @@ class GameEngine:
             # Random narrative events with appropriate probabilities
             self.process_random_events()
 
-            # Get player command
+            # Get player command; empty input re-prompts without starting a new turn,
+            # so location effects, consumption and random events only run once per command
             command = input("\n> ").strip()
-            if not command:
+            while not command:
                 print("Please enter a command. Type 'help' for assistance.")
-                continue
+                command = input("\n> ").strip()
 
             # Process the command
             result = self.process_command(command)
@@ -349,32 +519,17 @@ class GameEngine:
     
     def consume_resources(self):
         """Apply resource consumption based on character type and location."""
-        if isinstance(self.player, Migrant):
-            base_water_consumption = 5
-            base_food_consumption = 5
-            
-            # Modify consumption based on location type
-            if isinstance(self.current_location, Desert):
-                base_water_consumption += self.current_location.water_scarcity // 2
-                base_food_consumption += 2
-            elif isinstance(self.current_location, Settlement) and self.current_location.has_service("food"):
-                base_food_consumption = max(0, base_food_consumption - 3)
-            
-            return self.player.consume_resources(base_water_consumption, base_food_consumption)
-            
-        elif isinstance(self.player, BorderPatrol):
-            # Border Patrol consumes resources at a slower rate
-            base_water_consumption = 3
-            base_food_consumption = 3
-            
-            # Still affected by desert conditions, but less severely
-            if isinstance(self.current_location, Desert):
-                base_water_consumption += self.current_location.water_scarcity // 3
-                base_food_consumption += 1
-                
-            return self.player.consume_resources(base_water_consumption, base_food_consumption)
+        base_consumption = self.player.BASE_CONSUMPTION
+        if base_consumption is None:
+            return None
         
-        return None
+        water, food = base_consumption
+        # Modify consumption based on location type
+        if self.current_location is not None:
+            water, food = self.current_location.adjust_consumption(self.player, water, food)
+        
+        return self.player.consume_resources(int(water * RESOURCE_CONSUMPTION),
+                                             int(food * RESOURCE_CONSUMPTION))
 
     def process_random_events(self):
         """Process random narrative and trauma events."""
@@ -391,10 +546,10 @@ class GameEngine:
             if trauma:
                 self.story.update_journey_stats("trauma_experienced")
                 # Apply effects to character
-                if hasattr(self.player, 'hope'):
+                if 'hope' in self.player.STATS:
                     hope_change = self.player.change_hope(-10)
                     print(hope_change)
-                if hasattr(self.player, 'stress'):
+                if 'stress' in self.player.STATS:
                     self.player.stress = min(100, self.player.stress + 15)
                     print(f"{self.player.name}'s stress increases due to the traumatic experience.")
     
@@ -408,7 +563,7 @@ class GameEngine:
             return "Please enter a command. Type 'help' for assistance."
         
         # Try to use AI embeddings to understand natural language commands
-        if self.embeddings_engine:
+        if self.embeddings_engine and self.embeddings_engine.available and command not in _EXACT_COMMANDS:
             try:
                 # First try to match the command type
                 best_command, score = self.embeddings_engine.find_best_command(command)
@@ -422,7 +577,7 @@ class GameEngine:
                     # If it's a talk command, try to find the character
                     elif best_command == "talk":
                         # Extract potential character name from input
-                        potential_target = command.replace("talk", "").replace("to", "").replace("with", "").strip()
+                        potential_target = _TALK_WORDS.sub("", command).strip()
                         if potential_target:
                             best_character, char_score = self.embeddings_engine.find_best_character(potential_target)
                             if best_character and char_score > 0.6:
@@ -430,7 +585,7 @@ class GameEngine:
                     
                     # If it's a take command, try to find the item
                     elif best_command == "take":
-                        potential_item = command.replace("take", "").replace("get", "").replace("pick up", "").strip()
+                        potential_item = _TAKE_WORDS.sub("", command).strip()
                         if potential_item:
                             best_item, item_score = self.embeddings_engine.find_best_item(potential_item)
                             if best_item and item_score > 0.6:
@@ -438,7 +593,7 @@ class GameEngine:
                     
                     # If it's a use command, try to find the item
                     elif best_command == "use":
-                        potential_item = command.replace("use", "").strip()
+                        potential_item = _USE_WORDS.sub("", command).strip()
                         if potential_item:
                             best_item, item_score = self.embeddings_engine.find_best_item(potential_item)
                             if best_item and item_score > 0.6:
@@ -456,72 +611,29 @@ class GameEngine:
         
         # Traditional command processing as fallback
         
-        # Movement commands
-        if command.startswith("move ") or command.startswith("go "):
-            parts = command.split(" ", 1)
-            if len(parts) > 1:
-                direction = parts[1]
-                return self.move(direction)
-            else:
-                return "Move where? Try 'move north', 'move south', etc."
-        
         # Direction shortcuts
-        if command in ["north", "south", "east", "west", "n", "s", "e", "w"]:
-            # Convert single letter directions to full words
-            if command == "n": command = "north"
-            elif command == "s": command = "south"
-            elif command == "e": command = "east"
-            elif command == "w": command = "west"
-            
-            return self.move(command)
-        
-        # Talk command
-        if command.startswith("talk ") or command.startswith("speak "):
-            parts = command.split(" ", 1)
-            if len(parts) > 1:
-                target = parts[1]
-                return self.interact("talk", target)
-            else:
-                return "Talk to whom? Try 'talk [character name]'."
-        
-        # Take command
-        if command.startswith("take ") or command.startswith("get "):
-            parts = command.split(" ", 1)
-            if len(parts) > 1:
-                target = parts[1]
-                return self.interact("take", target)
-            else:
-                return "Take what? Try 'take [item name]'."
-        
-        # Use Service command
-        if command.startswith("use service "):
-            parts = command.split(" ", 2)
-            if len(parts) > 2:
-                service = parts[2]
-                return self.interact("use_service", service)
-            else:
-                return "Use which service? Try 'use service [food/shelter/medical]'"
+        direction = _DIRECTIONS.get(command)
+        if direction:
+            return self.move(direction)
         
-        # Use command
-        if command.startswith("use "):
-            parts = command.split(" ", 1)
-            if len(parts) > 1:
-                target = parts[1]
-                return self.interact("use", target)
-            else:
-                return "Use what? Try 'use [item name]'."
+        # Commands with a target: the command is stripped, so a verb followed
+        # by a space always has a non-empty target
+        verb, separator, target = command.partition(" ")
+        if separator:
+            if verb in _MOVE_VERBS:
+                return self.move(target)
+            action = _TARGET_VERBS.get(verb)
+            if action == "use" and target.startswith("service "):
+                return self.interact("use_service", target[len("service "):])
+            if action:
+                return self.interact(action, target)
         
         # Other commands
-        if command == "look" or command == "examine":
-            return self.interact("look")
-        
-        if command == "status" or command == "inventory":
-            return self.interact("status")
+        action = _SIMPLE_COMMANDS.get(command)
+        if action:
+            return self.interact(action)
         
-        if command == "help":
-            return self.interact("help")
-        
-        if command == "quit" or command == "exit":
+        if command in _QUIT_COMMANDS:
             return "QUIT"
         
         # Unknown command
@@ -532,11 +644,10 @@ class GameEngine:
         if not self.current_location:
             return "You are nowhere."
 
-        if direction not in self.current_location.connections:
-            return f"You cannot go {direction} from here."
-            
         # Get the destination
-        destination = self.current_location.connections[direction]
+        destination = self.current_location.connections.get(direction)
+        if destination is None:
+            return f"You cannot go {direction} from here."
 
         # Special handling for Border Patrol trying to enter Mexico
         from character import BorderPatrol
@@ -627,19 +738,19 @@ class GameEngine:
             return True
             
         # Check if water reached 0 (for migrants)
-        if hasattr(self.player, 'water') and self.player.water <= 0:
+        if 'water' in self.player.STATS and self.player.water <= 0:
             self.game_over = True
             self.ending = "death"
             return True
             
         # Check if reached final destination (Tucson)
-        if self.current_location == self.world.get("tucson"):
+        if self.current_location is self.world.get("tucson"):
             self.game_over = True
             self.ending = "success"
             return True
             
         # Check if detained
-        if self.current_location == self.world.get("detention_center") and isinstance(self.player, Migrant):
+        if self.current_location is self.world.get("detention_center") and isinstance(self.player, Migrant):
             self.game_over = True
             self.ending = "detained"
             return True
@@ -683,29 +794,16 @@ class GameEngine:
         health_bar = self.get_visual_bar(self.player.health)
         status += f"Health: {self.player.health}/100 {health_bar}\n"
         
-        # Resource displays with visual indicators
-        if hasattr(self.player, 'water'):
-            water_bar = self.get_visual_bar(self.player.water)
-            status += f"Water: {self.player.water}/100 {water_bar}\n"
-            
-        if hasattr(self.player, 'food'):
-            food_bar = self.get_visual_bar(self.player.food)
-            status += f"Food: {self.player.food}/100 {food_bar}\n"
-            
-        if hasattr(self.player, 'money'):
-            status += f"Money: ${self.player.money}\n"
-            
-        if hasattr(self.player, 'hope'):
-            hope_bar = self.get_visual_bar(self.player.hope)
-            status += f"Hope: {self.player.hope}/100 {hope_bar}\n"
-            
-        if hasattr(self.player, 'moral_compass'):
-            moral_bar = self.get_visual_bar(self.player.moral_compass)
-            status += f"Moral Compass: {self.player.moral_compass}/100 {moral_bar}\n"
-            
-        if hasattr(self.player, 'stress'):
-            stress_bar = self.get_visual_bar(self.player.stress, invert=True)
-            status += f"Stress: {self.player.stress}/100 {stress_bar}\n"
+        # Resource displays with visual indicators, for the stats this character has
+        player_stats = self.player.STATS
+        for stat, label, invert in _STATUS_STATS:
+            if stat not in player_stats:
+                continue
+            value = getattr(self.player, stat)
+            if invert is None:
+                status += f"{label}: ${value}\n"
+            else:
+                status += f"{label}: {value}/100 {self.get_visual_bar(value, invert=invert)}\n"
             
         # Inventory display
         status += f"Inventory: {', '.join(self.player.inventory) if self.player.inventory else 'Empty'}\n"
@@ -723,30 +821,7 @@ class GameEngine:
         Returns:
             str: A visual bar representation
         """
-        filled_char = "█"
-        empty_char = "░"
-        
-        # Calculate filled portion
-        value = max(0, min(100, value))  # Ensure value is in 0-100 range
-        filled_length = int(value / 100 * length)
-        empty_length = length - filled_length
-        
-        if invert:
-            # For inverted stats (like stress), high is bad
-            if value >= 80:
-                return f"[!] {filled_char * filled_length}{empty_char * empty_length} [CRITICAL]"
-            elif value >= 60:
-                return f"[!] {filled_char * filled_length}{empty_char * empty_length} [HIGH]"
-            else:
-                return f"{filled_char * filled_length}{empty_char * empty_length}"
-        else:
-            # For normal stats, low is bad
-            if value <= 20:
-                return f"[!] {filled_char * filled_length}{empty_char * empty_length} [CRITICAL]"
-            elif value <= 40:
-                return f"[!] {filled_char * filled_length}{empty_char * empty_length} [LOW]"
-            else:
-                return f"{filled_char * filled_length}{empty_char * empty_length}"
+        return _visual_bar(value, length, invert)
     
     def interact(self, action, target=None):
         """Perform an interaction in the game.
@@ -786,8 +861,9 @@ class GameEngine:
                     print(f"Error in AI character matching: {e}")
                     
             # Find character in current location
+            target_lower = target.lower()
             for character in self.current_location.characters:
-                if character != self.player and target.lower() in character.name.lower():
+                if character is not self.player and target_lower in character.name.lower():
                     # Increment turn counter
                     self.turn_count += 1
 
@@ -823,14 +899,7 @@ class GameEngine:
                     print(f"Error in AI item matching: {e}")
 
             # Check if item is in location
-            item_found = None
-            for item in self.current_location.items:
-                # More robust matching
-                item_lower = item.lower()
-                target_lower = target.lower()
-                if item_lower == target_lower or item_lower.startswith(target_lower) or item_lower.endswith(target_lower):
-                    item_found = item
-                    break
+            item_found = _find_item(self.current_location.items, target)
 
             if item_found:
                 self.current_location.remove_item(item_found)
@@ -861,176 +930,158 @@ class GameEngine:
                     print(f"Error in AI item matching: {e}")
 
             # Check if item is in inventory
-            item_to_use = None
-            for item in self.player.inventory:
-                 # More robust matching
-                 item_lower = item.lower()
-                 target_lower = target.lower()
-                 if item_lower == target_lower or item_lower.startswith(target_lower) or item_lower.endswith(target_lower):
-                     item_to_use = item
-                     break # Found item
+            item_to_use = _find_item(self.player.inventory, target)
 
             if item_to_use:
                 item_lower = item_to_use.lower() # Use the actual found item name
                 self.turn_count += 1
                 
                 # Store original stats for feedback on changes
-                old_stats = {}
-                if hasattr(self.player, 'water'):
-                    old_stats['water'] = self.player.water
-                if hasattr(self.player, 'food'):
-                    old_stats['food'] = self.player.food
-                if hasattr(self.player, 'health'):
-                    old_stats['health'] = self.player.health
-                if hasattr(self.player, 'hope'):
-                    old_stats['hope'] = self.player.hope
+                player_stats = self.player.STATS
+                old_stats = {stat: getattr(self.player, stat) for stat in _USE_TRACKED_STATS
+                             if stat in player_stats}
 
                 # Apply item effects
-                if "water bottle" in item_lower:
-                    if hasattr(self.player, 'water'):
-                        self.player.water = min(100, self.player.water + 30)
-                        change = self.player.water - old_stats['water']
-                        # Only consume the item if it's not the only water source
-                        if len([i for i in self.player.inventory if "water bottle" in i.lower()]) > 1:
-                            self.player.remove_from_inventory(item_to_use)
-                            return f"You drink from the water bottle, restoring {change} water. The bottle is now empty."
-                        return f"You drink from the water bottle, restoring {change} water. You can refill it if you find a water source."
-                    else:
-                        return "You drink from the water bottle, but it doesn't seem to affect you much."
-
-                elif "canned food" in item_lower:
-                    if hasattr(self.player, 'food'):
-                        self.player.food = min(100, self.player.food + 40)
-                        change = self.player.food - old_stats['food']
-                        self.player.remove_from_inventory(item_to_use)
-                        return f"You eat the canned food, satisfying your hunger (+{change} food)."
-                    else:
-                        return "You eat the canned food, but it doesn't seem to affect you much."
-
-                elif "first aid kit" in item_lower:
-                    self.player.health = min(100, self.player.health + 25)
-                    change = self.player.health - old_stats['health']
-                    self.player.remove_from_inventory(item_to_use)
-                    return f"You use the first aid kit, treating some wounds (+{change} health)."
-
-                elif "map" in item_lower:
-                     # Reveal connections in more detail
-                     connections_desc = []
-                     for direction, loc in self.current_location.connections.items():
-                         danger_level = "Low risk" if loc.danger_level <= 3 else "Medium risk" if loc.danger_level <= 6 else "High risk"
-                         connections_desc.append(f"{direction.title()}: {loc.name} ({danger_level})")
-                     
-                     map_desc = "You consult the map. Available paths:\n"
-                     map_desc += "\n".join(connections_desc) if connections_desc else "No clear paths marked on the map."
-                     return map_desc
-
-                elif "flashlight" in item_lower:
-                    # More useful for night events or dark locations
-                    current_location_name = self.current_location.name.lower()
-                    if "tunnel" in current_location_name or "cave" in current_location_name:
-                        return "The flashlight illuminates the darkness, revealing details you couldn't see before."
-                    elif hasattr(self.player, 'hope'):
-                        self.player.hope = min(100, self.player.hope + 5)
-                        return "You turn on the flashlight. Its beam provides some comfort in the uncertainty."
-                    else:
-                        return "You turn on the flashlight. Its beam cuts through the ambient light."
-
-                elif "compass" in item_lower:
-                    # More practical use for the compass
-                    if hasattr(self.player, 'hope'):
-                        self.player.hope = min(100, self.player.hope + 5)
-                        return "You check the compass. Knowing your exact orientation gives you confidence in your path."
-                    else:
-                        return "You check the compass. North is pointing to Tucson, your ultimate destination."
-
-                elif "family photo" in item_lower:
-                    if hasattr(self.player, 'hope'):
-                        old_hope = self.player.hope
-                        hope_result = self.player.change_hope(15)
-                        change = self.player.hope - old_hope
-                        return f"You look at the photo of your family. Their faces remind you of why this journey matters. (+{change} hope)"
-                    else:
-                        return "You look at the photo, feeling a mix of emotions."
-
-                # Added effects for previously unused items
-                elif "blanket" in item_lower:
-                    if hasattr(self.player, 'health'):
-                        self.player.health = min(100, self.player.health + 10)
-                        change = self.player.health - old_stats['health']
-                        return f"You wrap the blanket around yourself, getting some much-needed rest. (+{change} health)"
-                    else:
-                        return "You wrap the blanket around yourself. It provides some comfort against the elements."
-
-                elif "money" in item_lower:
-                    # Set a flag for potential future interactions
-                    self.player.set_flag("showed_money", True)
-                    return "You count your money, making sure you have enough for emergencies. Having resources gives you options, but be careful who sees your wealth."
-
-                elif "id papers" in item_lower:
-                    # Set a flag for potential future interactions
-                    self.player.set_flag("showed_papers", True)
-                    if isinstance(self.player, Migrant):
-                        return "You check your ID papers. They might help with asylum claims, but could also reveal your identity to those who would exploit you."
-                    else:
-                        return "You check your credentials and identification. Your authority comes with responsibility."
-                
-                elif "radio" in item_lower and isinstance(self.player, BorderPatrol):
-                    # More useful information for Border Patrol
-                    if random.random() < 0.5:  # 50% chance of useful info
-                        intel_options = [
-                            "Radio reports suspicious activity near the border fence.",
-                            "Dispatch mentions a group of migrants spotted heading north through the desert.",
-                            "Another agent reports finding abandoned supplies near your position.",
-                            "You hear chatter about cartel activity increasing in the region.",
-                            "A helicopter patrol reports movement along the eastern ridge."
-                        ]
-                        intel = random.choice(intel_options)
-                        # Update story stats
-                        self.story.update_journey_stats("event", intel)
-                        return f"You use the radio. {intel}"
-                    return "You check in on the radio but hear only routine chatter and static."
-
-                elif "radio" in item_lower:
-                    # For migrants, the radio provides different information
-                    if isinstance(self.player, Migrant):
-                        radio_info = random.choice([
-                            "You pick up border patrol frequencies. They seem to be focused on the western sector today.",
-                            "The radio catches a weather report - extreme heat warnings for the next few days.",
-                            "You hear scattered voices discussing patrol schedules. This information could be valuable.",
-                            "Static fills the frequencies. It's hard to make out anything useful."
-                        ])
-                        return f"You carefully listen to the radio. {radio_info}"
-                    else:
-                        return "You use the radio but can't make sense of the transmissions."
-
-                else:
+                handler = self._USE_HANDLERS.get(_use_keyword(item_lower))
+                if handler is None:
                     return f"You use the {item_to_use}, but nothing special happens."
+                return handler(self, item_to_use, old_stats)
 
             # If loop finishes without finding item in inventory
             return f"You don't have {original_target} in your inventory."
             
         elif action == "help":
-            help_text = "\nAvailable commands: \n"
-            help_text += "- look: Examine your surroundings\n"
-            help_text += "- status: Check your current status and inventory\n"
-            help_text += "- talk [character]: Talk to a character\n"
-            help_text += "- take [item]: Take an item\n"
-            help_text += "- use [item]: Use an item from your inventory\n"
-            help_text += "- use service [type]: Access settlement services (food/shelter/medical)\n"
-            help_text += "- move [direction]: Move in a direction (north, south, east, west)\n"
-            help_text += "- help: Show this help text\n"
-            help_text += "- quit: Exit the game\n"
-            
             # Add information about AI natural language processing if available
-            if self.embeddings_engine:
-                help_text += "\nThis game features AI-powered natural language understanding.\n"
-                help_text += "You can use more natural phrases like:\n"
-                help_text += "- 'check my health' instead of 'status'\n"
-                help_text += "- 'speak with Manuel' instead of 'talk Manuel'\n"
-                help_text += "- 'grab the water' instead of 'take water bottle'\n"
-                help_text += "- 'drink from my bottle' instead of 'use water bottle'\n"
-                help_text += "- 'head north' instead of 'move north'\n"
+            return _AI_HELP_TEXT if self.embeddings_engine and self.embeddings_engine.available else _HELP_TEXT
             
-            return help_text
-            
-        return f"I don't understand '{action}'."
\ No newline at end of file
+        return f"I don't understand '{action}'."
+    
+    def _use_water_bottle(self, item, old_stats):
+        """Drink from a water bottle, consuming it only if another one is carried."""
+        if 'water' in self.player.STATS:
+            self.player.water = min(100, self.player.water + 30)
+            change = self.player.water - old_stats['water']
+            # Only consume the item if it's not the only water source
+            if _has_several(self.player.inventory, "water bottle"):
+                self.player.remove_from_inventory(item)
+                return f"You drink from the water bottle, restoring {change} water. The bottle is now empty."
+            return f"You drink from the water bottle, restoring {change} water. You can refill it if you find a water source."
+        else:
+            return "You drink from the water bottle, but it doesn't seem to affect you much."
+    
+    def _use_canned_food(self, item, old_stats):
+        """Eat canned food."""
+        if 'food' in self.player.STATS:
+            self.player.food = min(100, self.player.food + 40)
+            change = self.player.food - old_stats['food']
+            self.player.remove_from_inventory(item)
+            return f"You eat the canned food, satisfying your hunger (+{change} food)."
+        else:
+            return "You eat the canned food, but it doesn't seem to affect you much."
+    
+    def _use_first_aid_kit(self, item, old_stats):
+        """Treat wounds with a first aid kit."""
+        self.player.health = min(100, self.player.health + 25)
+        change = self.player.health - old_stats['health']
+        self.player.remove_from_inventory(item)
+        return f"You use the first aid kit, treating some wounds (+{change} health)."
+    
+    def _use_map(self, item, old_stats):
+        """Describe the paths from the current location and their risk."""
+        # Reveal connections in more detail
+        connections_desc = []
+        for direction, loc in self.current_location.connections.items():
+            danger_level = "Low risk" if loc.danger_level <= 3 else "Medium risk" if loc.danger_level <= 6 else "High risk"
+            connections_desc.append(f"{direction.title()}: {loc.name} ({danger_level})")
+        
+        map_desc = "You consult the map. Available paths:\n"
+        map_desc += "\n".join(connections_desc) if connections_desc else "No clear paths marked on the map."
+        return map_desc
+    
+    def _use_flashlight(self, item, old_stats):
+        """Turn on a flashlight."""
+        # More useful for night events or dark locations
+        current_location_name = self.current_location.name.lower()
+        if "tunnel" in current_location_name or "cave" in current_location_name:
+            return "The flashlight illuminates the darkness, revealing details you couldn't see before."
+        elif 'hope' in self.player.STATS:
+            self.player.hope = min(100, self.player.hope + 5)
+            return "You turn on the flashlight. Its beam provides some comfort in the uncertainty."
+        else:
+            return "You turn on the flashlight. Its beam cuts through the ambient light."
+    
+    def _use_compass(self, item, old_stats):
+        """Check a compass."""
+        # More practical use for the compass
+        if 'hope' in self.player.STATS:
+            self.player.hope = min(100, self.player.hope + 5)
+            return "You check the compass. Knowing your exact orientation gives you confidence in your path."
+        else:
+            return "You check the compass. North is pointing to Tucson, your ultimate destination."
+    
+    def _use_family_photo(self, item, old_stats):
+        """Look at a family photo for hope."""
+        if 'hope' in self.player.STATS:
+            old_hope = self.player.hope
+            hope_result = self.player.change_hope(15)
+            change = self.player.hope - old_hope
+            return f"You look at the photo of your family. Their faces remind you of why this journey matters. (+{change} hope)"
+        else:
+            return "You look at the photo, feeling a mix of emotions."
+    
+    def _use_blanket(self, item, old_stats):
+        """Rest under a blanket."""
+        if 'health' in self.player.STATS:
+            self.player.health = min(100, self.player.health + 10)
+            change = self.player.health - old_stats['health']
+            return f"You wrap the blanket around yourself, getting some much-needed rest. (+{change} health)"
+        else:
+            return "You wrap the blanket around yourself. It provides some comfort against the elements."
+    
+    def _use_money(self, item, old_stats):
+        """Count money."""
+        # Set a flag for potential future interactions
+        self.player.set_flag("showed_money", True)
+        return "You count your money, making sure you have enough for emergencies. Having resources gives you options, but be careful who sees your wealth."
+    
+    def _use_id_papers(self, item, old_stats):
+        """Check ID papers or credentials."""
+        # Set a flag for potential future interactions
+        self.player.set_flag("showed_papers", True)
+        if isinstance(self.player, Migrant):
+            return "You check your ID papers. They might help with asylum claims, but could also reveal your identity to those who would exploit you."
+        else:
+            return "You check your credentials and identification. Your authority comes with responsibility."
+    
+    def _use_radio(self, item, old_stats):
+        """Listen to the radio; agents may pick up intel, migrants patrol chatter."""
+        if isinstance(self.player, BorderPatrol):
+            # More useful information for Border Patrol
+            if random.random() < 0.5:  # 50% chance of useful info
+                intel = random.choice(_PATROL_RADIO_INTEL)
+                # Update story stats
+                self.story.update_journey_stats("event", intel)
+                return f"You use the radio. {intel}"
+            return "You check in on the radio but hear only routine chatter and static."
+        
+        # For migrants, the radio provides different information
+        if isinstance(self.player, Migrant):
+            radio_info = random.choice(_MIGRANT_RADIO_INFO)
+            return f"You carefully listen to the radio. {radio_info}"
+        else:
+            return "You use the radio but can't make sense of the transmissions."
+    
+    # Item use handlers by the keyword that selects them (see _USE_KEYWORDS)
+    _USE_HANDLERS = {
+        "water bottle": _use_water_bottle,
+        "canned food": _use_canned_food,
+        "first aid kit": _use_first_aid_kit,
+        "map": _use_map,
+        "flashlight": _use_flashlight,
+        "compass": _use_compass,
+        "family photo": _use_family_photo,
+        "blanket": _use_blanket,
+        "money": _use_money,
+        "id papers": _use_id_papers,
+        "radio": _use_radio,
+    }
\ No newline at end of file
@@ -11,6 +11,10 @@ from character import Migrant, BorderPatrol
 class Location:
     """Base class for all game locations."""
     
+    __slots__ = ("name", "description", "danger_level", "characters", "items", "connections",
+                 "visited", "events", "auto_event", "environment", "time_of_day",
+                 "_desc_version", "_desc_cache")
+    
     def __init__(self, name, description, danger_level=0):
         """Initialize a location.
         
@@ -30,21 +34,39 @@ class Location:
         self.auto_event = None # Event that triggers automatically upon arrival
         self.environment = {} # Environmental factors (visibility, terrain, etc.)
         self.time_of_day = "day" # Current time of day
+        self._desc_version = 0  # Bumped whenever a described attribute changes
+        self._desc_cache = (None, None)  # (version key, rendered detailed description)
         
     def describe(self, detailed=False):
         """Return a description of the location.
         
+        The detailed text is reused until something it shows changes.
+        
         Args:
             detailed (bool): Whether to include detailed information
             
         Returns:
             str: Location description
         """
+        if not detailed:
+            return f"{self.name}: {self.description}"
+        
+        key = self._describe_key()
+        cached_key, cached_desc = self._desc_cache
+        if cached_key == key:
+            return cached_desc
+        desc = self._render_description()
+        self._desc_cache = (key, desc)
+        return desc
+    
+    def _describe_key(self):
+        """Return a value that changes whenever the detailed description would."""
+        return (self._desc_version, self.danger_level, self.time_of_day)
+    
+    def _render_description(self):
+        """Build the detailed location description from scratch."""
         base_desc = f"{self.name}: {self.description}"
         
-        if not detailed:
-            return base_desc
-            
         # Add details about danger
         danger_desc = "\nDanger Level: "
         if self.danger_level <= 2:
@@ -111,6 +133,7 @@ class Location:
             location: Location to connect to
         """
         self.connections[direction] = location
+        self._desc_version += 1
         
     def add_character(self, character):
         """Add a character to this location.
@@ -120,6 +143,7 @@ class Location:
         """
         self.characters.append(character)
         character.location = self
+        self._desc_version += 1
         
     def remove_character(self, character):
         """Remove a character from this location.
@@ -134,6 +158,7 @@ class Location:
             self.characters.remove(character)
             if character.location == self:
                 character.location = None
+            self._desc_version += 1
             return True
         return False
                 
@@ -144,6 +169,7 @@ class Location:
             item (str): Item to add
         """
         self.items.append(item)
+        self._desc_version += 1
         
     def remove_item(self, item):
         """Remove an item from this location if present.
@@ -156,6 +182,7 @@ class Location:
         """
         if item in self.items:
             self.items.remove(item)
+            self._desc_version += 1
             return True
         return False
     
@@ -185,6 +212,20 @@ class Location:
             value: Value of the factor
         """
         self.environment[key] = value
+        self._desc_version += 1
+    
+    def adjust_consumption(self, character, water, food):
+        """Adjust a character's per-turn water and food consumption for this location.
+        
+        Args:
+            character: Character consuming resources
+            water (int): Base water consumption
+            food (int): Base food consumption
+            
+        Returns:
+            tuple: Adjusted (water, food) consumption
+        """
+        return water, food
     
     def apply_effects(self, character):
         """Apply location-specific effects to a character.
@@ -220,6 +261,8 @@ class Location:
 class Desert(Location):
     """A desert location with extreme conditions."""
     
+    __slots__ = ("water_scarcity",)
+    
     def __init__(self, name, description, water_scarcity=8, danger_level=7):
         """Initialize a desert location.
         
@@ -240,40 +283,48 @@ class Desert(Location):
         if random.random() < 0.3:  # 30% chance of having an item
             self.add_item(random.choice(desert_items))
         
-    def describe(self, detailed=False):
-        """Return a description of the desert location.
+    def _describe_key(self):
+        """Include water scarcity, which is a plain attribute."""
+        return (super()._describe_key(), self.water_scarcity)
+    
+    def _render_description(self):
+        """Build the detailed desert description."""
+        base_desc = super()._render_description()
+        
+        water_desc = "\nWater: "
+        if self.water_scarcity >= 8:
+            water_desc += "Critically scarce - No water sources visible."
+        elif self.water_scarcity >= 5:
+            water_desc += "Very limited - Might find small amounts if lucky."
+        else:
+            water_desc += "Limited - Some water sources may be found."
+            
+        # Add time-specific descriptions
+        time_desc = "\nTime: "
+        if self.time_of_day == "dawn":
+            time_desc += "Dawn brings brief respite from the heat, but the day's furnace is awakening."
+        elif self.time_of_day == "day":
+            time_desc += "The sun is merciless, baking the sand and everything upon it."
+        elif self.time_of_day == "dusk":
+            time_desc += "The setting sun paints the dunes in gold and crimson as the air begins to cool."
+        else:  # night
+            time_desc += "Desert night brings bitter cold, a cruel contrast to the day's heat."
+            
+        return base_desc + water_desc + time_desc
+    
+    def adjust_consumption(self, character, water, food):
+        """Increase consumption with the desert's water scarcity.
         
         Args:
-            detailed (bool): Whether to include detailed information
+            character: Character consuming resources
+            water (int): Base water consumption
+            food (int): Base food consumption
             
         Returns:
-            str: Desert description
+            tuple: Adjusted (water, food) consumption
         """
-        base_desc = super().describe(detailed)
-        
-        if detailed:
-            water_desc = "\nWater: "
-            if self.water_scarcity >= 8:
-                water_desc += "Critically scarce - No water sources visible."
-            elif self.water_scarcity >= 5:
-                water_desc += "Very limited - Might find small amounts if lucky."
-            else:
-                water_desc += "Limited - Some water sources may be found."
-                
-            # Add time-specific descriptions
-            time_desc = "\nTime: "
-            if self.time_of_day == "dawn":
-                time_desc += "Dawn brings brief respite from the heat, but the day's furnace is awakening."
-            elif self.time_of_day == "day":
-                time_desc += "The sun is merciless, baking the sand and everything upon it."
-            elif self.time_of_day == "dusk":
-                time_desc += "The setting sun paints the dunes in gold and crimson as the air begins to cool."
-            else:  # night
-                time_desc += "Desert night brings bitter cold, a cruel contrast to the day's heat."
-                
-            return base_desc + water_desc + time_desc
-            
-        return base_desc
+        scarcity_divisor, extra_food = character.DESERT_CONSUMPTION
+        return water + self.water_scarcity // scarcity_divisor, food + extra_food
     
     def apply_effects(self, character):
         """Apply desert-specific effects to a character.
@@ -356,6 +407,8 @@ class Desert(Location):
 class Border(Location):
     """A border location with patrol presence."""
     
+    __slots__ = ("patrol_intensity", "surveillance_level")
+    
     def __init__(self, name, description, patrol_intensity=5, danger_level=6):
         """Initialize a border location.
         
@@ -378,49 +431,43 @@ class Border(Location):
         if random.random() < 0.3:  # 30% chance of having an item
             self.add_item(random.choice(border_items))
         
-    def describe(self, detailed=False):
-        """Return a description of the border location.
-        
-        Args:
-            detailed (bool): Whether to include detailed information
-            
-        Returns:
-            str: Border description
-        """
-        base_desc = super().describe(detailed)
-        
-        if detailed:
-            patrol_desc = "\nPatrol: "
-            if self.patrol_intensity >= 8:
-                patrol_desc += "Heavy presence - Constant surveillance and patrols."
-            elif self.patrol_intensity >= 5:
-                patrol_desc += "Moderate presence - Regular patrols pass through."
-            else:
-                patrol_desc += "Light presence - Occasional patrols in the area."
-                
-            # Add time-specific border descriptions
-            time_desc = "\nTime: "
-            if self.time_of_day == "dawn":
-                time_desc += "Dawn shift change brings fresh patrols and renewed vigilance."
-            elif self.time_of_day == "day":
-                time_desc += "Daylight makes crossing more visible, but patrols more predictable."
-            elif self.time_of_day == "dusk":
-                time_desc += "Dusk brings increased crossing attempts as visibility decreases."
-            else:  # night
-                time_desc += "Night operations use thermal imaging and night vision to detect movement."
-                
-            # Add surveillance description
-            surveillance_desc = "\nSurveillance: "
-            if self.surveillance_level >= 80:
-                surveillance_desc += "Multiple cameras, sensors, and drones monitor the area constantly."
-            elif self.surveillance_level >= 50:
-                surveillance_desc += "Periodic drone flights and stationary cameras cover key crossing points."
-            else:
-                surveillance_desc += "Basic surveillance with occasional monitoring."
-                
-            return base_desc + patrol_desc + time_desc + surveillance_desc
+    def _describe_key(self):
+        """Include patrol and surveillance levels, which are plain attributes."""
+        return (super()._describe_key(), self.patrol_intensity, self.surveillance_level)
+    
+    def _render_description(self):
+        """Build the detailed border description."""
+        base_desc = super()._render_description()
+        
+        patrol_desc = "\nPatrol: "
+        if self.patrol_intensity >= 8:
+            patrol_desc += "Heavy presence - Constant surveillance and patrols."
+        elif self.patrol_intensity >= 5:
+            patrol_desc += "Moderate presence - Regular patrols pass through."
+        else:
+            patrol_desc += "Light presence - Occasional patrols in the area."
+            
+        # Add time-specific border descriptions
+        time_desc = "\nTime: "
+        if self.time_of_day == "dawn":
+            time_desc += "Dawn shift change brings fresh patrols and renewed vigilance."
+        elif self.time_of_day == "day":
+            time_desc += "Daylight makes crossing more visible, but patrols more predictable."
+        elif self.time_of_day == "dusk":
+            time_desc += "Dusk brings increased crossing attempts as visibility decreases."
+        else:  # night
+            time_desc += "Night operations use thermal imaging and night vision to detect movement."
+            
+        # Add surveillance description
+        surveillance_desc = "\nSurveillance: "
+        if self.surveillance_level >= 80:
+            surveillance_desc += "Multiple cameras, sensors, and drones monitor the area constantly."
+        elif self.surveillance_level >= 50:
+            surveillance_desc += "Periodic drone flights and stationary cameras cover key crossing points."
+        else:
+            surveillance_desc += "Basic surveillance with occasional monitoring."
             
-        return base_desc
+        return base_desc + patrol_desc + time_desc + surveillance_desc
     
     def encounter_chance(self):
         """Return the chance (0-100) of encountering border patrol.
@@ -504,6 +551,8 @@ class Border(Location):
 class Settlement(Location):
     """A settlement location with people and resources."""
     
+    __slots__ = ("population", "services", "attitude")
+    
     def __init__(self, name, description, population=0, danger_level=3):
         """Initialize a settlement location.
         
@@ -526,61 +575,55 @@ class Settlement(Location):
         if random.random() < 0.4:  # 40% chance of having an item
             self.add_item(random.choice(settlement_items))
         
-    def describe(self, detailed=False):
-        """Return a description of the settlement location.
-        
-        Args:
-            detailed (bool): Whether to include detailed information
+    def _describe_key(self):
+        """Include population and local attitude, which are plain attributes."""
+        return (super()._describe_key(), self.population, self.attitude)
+    
+    def _render_description(self):
+        """Build the detailed settlement description."""
+        base_desc = super()._render_description()
+        
+        pop_desc = "\nPopulation: "
+        if self.population > 100000:
+            pop_desc += "Major urban center"
+        elif self.population > 10000:
+            pop_desc += "Large community"
+        elif self.population > 1000:
+            pop_desc += "Medium-sized community"
+        elif self.population > 100:
+            pop_desc += "Small community"
+        else:
+            pop_desc += "Tiny settlement"
             
-        Returns:
-            str: Settlement description
-        """
-        base_desc = super().describe(detailed)
-        
-        if detailed:
-            pop_desc = "\nPopulation: "
-            if self.population > 100000:
-                pop_desc += "Major urban center"
-            elif self.population > 10000:
-                pop_desc += "Large community"
-            elif self.population > 1000:
-                pop_desc += "Medium-sized community"
-            elif self.population > 100:
-                pop_desc += "Small community"
-            else:
-                pop_desc += "Tiny settlement"
-                
-            services_desc = "\nServices: "
-            if self.services:
-                services_desc += ", ".join(self.services)
-            else:
-                services_desc += "No services available"
-                
-            # Add attitude description
-            attitude_desc = "\nLocal Attitude: "
-            if self.attitude == "friendly":
-                attitude_desc += "Residents seem welcoming and helpful."
-            elif self.attitude == "neutral":
-                attitude_desc += "People mind their own business, neither helpful nor hostile."
-            elif self.attitude == "wary":
-                attitude_desc += "Locals watch strangers with suspicion and keep their distance."
-            else:  # hostile
-                attitude_desc += "There's a palpable tension in the air. It's best to keep a low profile."
-                
-            # Add time-specific descriptions
-            time_desc = "\nTime: "
-            if self.time_of_day == "dawn":
-                time_desc += "The settlement stirs to life as the first light breaks."
-            elif self.time_of_day == "day":
-                time_desc += "Daily activities are in full swing, streets busy with locals."
-            elif self.time_of_day == "dusk":
-                time_desc += "People return home as businesses begin to close for the evening."
-            else:  # night
-                time_desc += "Streets are mostly empty, with only a few late-night establishments active."
-                
-            return base_desc + pop_desc + services_desc + attitude_desc + time_desc
+        services_desc = "\nServices: "
+        if self.services:
+            services_desc += ", ".join(self.services)
+        else:
+            services_desc += "No services available"
+            
+        # Add attitude description
+        attitude_desc = "\nLocal Attitude: "
+        if self.attitude == "friendly":
+            attitude_desc += "Residents seem welcoming and helpful."
+        elif self.attitude == "neutral":
+            attitude_desc += "People mind their own business, neither helpful nor hostile."
+        elif self.attitude == "wary":
+            attitude_desc += "Locals watch strangers with suspicion and keep their distance."
+        else:  # hostile
+            attitude_desc += "There's a palpable tension in the air. It's best to keep a low profile."
+            
+        # Add time-specific descriptions
+        time_desc = "\nTime: "
+        if self.time_of_day == "dawn":
+            time_desc += "The settlement stirs to life as the first light breaks."
+        elif self.time_of_day == "day":
+            time_desc += "Daily activities are in full swing, streets busy with locals."
+        elif self.time_of_day == "dusk":
+            time_desc += "People return home as businesses begin to close for the evening."
+        else:  # night
+            time_desc += "Streets are mostly empty, with only a few late-night establishments active."
             
-        return base_desc
+        return base_desc + pop_desc + services_desc + attitude_desc + time_desc
     
     def add_service(self, service):
         """Add an available service to this settlement.
@@ -590,6 +633,7 @@ class Settlement(Location):
         """
         if service not in self.services:
             self.services.append(service)
+            self._desc_version += 1
             
     def has_service(self, service):
         """Check if a specific service is available.
@@ -700,6 +744,21 @@ class Settlement(Location):
         
         return service_message if service_message else f"Used {service_name} service for ${cost}."
     
+    def adjust_consumption(self, character, water, food):
+        """Reduce food consumption where the settlement sells food.
+        
+        Args:
+            character: Character consuming resources
+            water (int): Base water consumption
+            food (int): Base food consumption
+            
+        Returns:
+            tuple: Adjusted (water, food) consumption
+        """
+        if character.SETTLEMENT_FOOD_DISCOUNT and self.has_service("food"):
+            food = max(0, food - character.SETTLEMENT_FOOD_DISCOUNT)
+        return water, food
+    
     def apply_effects(self, character):
         """Apply settlement-specific effects to a character.
         
@@ -313,6 +313,15 @@ class Story:
                 }
             ]
         }
+        
+        # Descriptions of random events that involve another character, matched once here
+        # rather than every time an event fires
+        self._character_event_descriptions = frozenset(
+            event["description"]
+            for events_pool in self.random_events.values()
+            for event in events_pool
+            if any(word in event["description"].lower() for word in ("encounter", "man", "person"))
+        )
 
         # Journey statistics tracking for narrative development
         self.journey_stats = {
@@ -1076,7 +1085,7 @@ class Story:
         self.update_journey_stats("key_events", event["description"])
 
         # Check if this event involves another character
-        if "encounter" in event["description"].lower() or "man" in event["description"].lower() or "person" in event["description"].lower():
+        if event["description"] in self._character_event_descriptions:
             self.update_journey_stats("lives_impacted")
         
         return event